@@ -1,10 +1,18 @@
 import pandas as pd
+import numpy as np
 import requests
-from bs4 import BeautifulSoup ,Tag
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup ,Tag, NavigableString, CData, SoupStrainer
+import soupsieve
 import json
+from html import unescape
 import os
+import shutil
+import tempfile
+import sys
 import time
-from urllib.parse import urljoin, urlparse, unquote
+from urllib.robotparser import RobotFileParser
+from urllib.parse import urljoin, urlparse, urlunparse, quote_plus, parse_qsl, urlencode
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -15,10 +23,14 @@ import re
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any, Set
-from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Any, Set, Iterable, Iterator
+from dataclasses import dataclass, field, fields, is_dataclass
 import hashlib
-from collections import defaultdict, deque
+from collections import defaultdict, deque, OrderedDict
+from functools import lru_cache
+from itertools import chain
+from contextlib import contextmanager
+import queue
 import random
 
 # ============================================================================
@@ -29,13 +41,22 @@ import random
 class EnhancedAnalyzerConfig:
     """Enhanced configuration settings for comprehensive website analysis"""
     MAX_WORKERS: int = 20                 # Maximum parallel processes
+    MAX_CRAWL_WORKERS: int = 8            # Concurrent page fetches per site during link discovery
     REQUEST_TIMEOUT: int = 50          # HTTP request timeout
     SELENIUM_TIMEOUT: int = 55            # Selenium page load timeout
+    SELENIUM_POOL_SIZE: int = 4           # Maximum Chrome instances shared by page workers
     MAX_PAGES_PER_SITE: int = 1000         # Maximum pages to analyze per site
     MAX_CRAWL_DEPTH: int = 45               # Maximum crawl depth
     MIN_HTML_LENGTH: int = 1000            # Minimum HTML length to consider valid
+    MAX_HTML_BYTES: int = 4 * 1024 * 1024  # Stop downloading a page body past this size
     MAX_RETRIES: int = 3                   # Maximum retry attempts
     DELAY_BETWEEN_REQUESTS: float = 20    # Delay between requests
+    RESULT_CACHE_SIZE: int = 10000         # Text-derived extraction results kept per extractor class
+    SOUP_CACHE_SIZE: int = 32              # Parsed page trees kept in memory per site
+    REQUESTS_PER_SECOND: float = 4.0      # Per-host request rate when robots.txt sets no Crawl-delay
+    ROBOTS_TIMEOUT: int = 10               # robots.txt fetch timeout
+    IMAGE_DOWNLOAD_WORKERS: int = 16       # Concurrent image downloads per site
+    IO_WORKERS: int = 4                    # Background threads writing raw-data artifacts per site
     COMPREHENSIVE_CRAWL: bool = True       # Enable comprehensive crawling
     EXTRACT_ALL_LINKS: bool = True         # Extract every possible link
     DISCOVER_GOOGLE_MAPS: bool = True      # Enhanced Google Maps discovery
@@ -43,6 +64,14 @@ class EnhancedAnalyzerConfig:
 
 config = EnhancedAnalyzerConfig()
 
+# BeautifulSoup tree builder: the libxml2-backed lxml parser when installed,
+# otherwise the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 # Error patterns to detect
 ERROR_PATTERNS = [
     r"520: Web server is returning an unknown error",
@@ -58,13 +87,27 @@ ERROR_PATTERNS = [
     r"503 Service Unavailable"
 ]
 
+# All error patterns fused into one alternation so each page is scanned once
+ERROR_PATTERNS_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in ERROR_PATTERNS))
+
 def detect_page_errors(html: str) -> bool:
     """
     Detect common error patterns in HTML content.
     Returns True if any error pattern is found, False otherwise.
     """
     html_lower = html.lower()
-    return any(re.search(pattern, html_lower) for pattern in ERROR_PATTERNS)
+    return bool(ERROR_PATTERNS_RE.search(html_lower))
+
+# Client-rendered app shells: an empty framework mount point, or a noscript notice
+SPA_MOUNT_RE = re.compile(r'<div[^>]+id=["\'](?:root|app|__next|__nuxt|svelte)["\'][^>]*>\s*</div>', re.I)
+NOSCRIPT_JS_NOTICE_RE = re.compile(r'<noscript[^>]*>[^<]*(?:enable|requires?)\s+javascript', re.I)
+
+def requires_js(html: str) -> bool:
+    """
+    Detect pages whose content is rendered client-side, so the static HTML
+    fetched over plain HTTP is only an empty shell.
+    """
+    return bool(SPA_MOUNT_RE.search(html) or NOSCRIPT_JS_NOTICE_RE.search(html))
 
 def should_retry_fetch(status_code: int, html: str) -> bool:
     """
@@ -86,6 +129,8 @@ def handle_fetch_error(url: str, status_code: int, html: str, attempt: int, max_
     """
     error_type = "UNKNOWN"
     
+    # Checked in priority order: the earliest matching branch wins, wherever
+    # its marker sits in the page
     if "520: Web server is returning an unknown error" in html:
         error_type = "520 Unknown Server Error"
     elif "Just a moment..." in html:
@@ -96,12 +141,12 @@ def handle_fetch_error(url: str, status_code: int, html: str, attempt: int, max_
         error_type = "Service Unavailable"
     elif "Cloudflare" in html:
         error_type = "Cloudflare Protection"
-    elif "captcha" in html.lower() or "security check" in html.lower():
-        error_type = "CAPTCHA Challenge"
-    elif "Not Found" in html or "Page Not Found" in html or "404 Error" in html:
-        error_type = "404 Not Found"
-    elif "503 Service Unavailable" in html:
-        error_type = "503 Service Unavailable"
+    else:
+        html_lower = html.lower()  # Lowered once for the case-insensitive markers
+        if "captcha" in html_lower or "security check" in html_lower:
+            error_type = "CAPTCHA Challenge"
+        elif "Not Found" in html or "404 Error" in html:
+            error_type = "404 Not Found"
     
     if should_retry_fetch(status_code, html) and attempt < max_retries:
         wait_time = 2 ** attempt + random.uniform(0, 1)
@@ -110,19 +155,61 @@ def handle_fetch_error(url: str, status_code: int, html: str, attempt: int, max_
     else:
         logger.error(f"Permanent error ({error_type}) on {url} - skipping after {attempt} attempts")
 
+# Per-thread HTTP session so fetch workers reuse pooled keep-alive connections
+_thread_local = threading.local()
+
+def get_thread_session() -> requests.Session:
+    """Return this thread's requests session, creating it on first use"""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        # Retries are handled by the callers, so the adapter never retries on its own
+        adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({'User-Agent': config.USER_AGENT})
+        _thread_local.session = session
+    return session
+
+def read_limited_text(response: requests.Response, max_bytes: Optional[int] = None) -> str:
+    """
+    Read a streamed response body up to max_bytes and decode it.
+    Nothing downstream needs more than the first few MiB of a page.
+    """
+    limit = max_bytes or config.MAX_HTML_BYTES
+    body = bytearray()
+    try:
+        for chunk in response.iter_content(chunk_size=65536):
+            body += chunk
+            if len(body) >= limit:
+                logger.debug(f"Truncated response from {response.url} at {limit} bytes")
+                del body[limit:]
+                break
+    finally:
+        response.close()
+    
+    # Use the Content-Type charset when declared, otherwise UTF-8; charset
+    # sniffing over a multi-MiB body costs more than the parse itself
+    encoding = response.encoding if 'charset' in response.headers.get('Content-Type', '').lower() else None
+    try:
+        return body.decode(encoding or 'utf-8', errors='replace')
+    except LookupError:
+        return body.decode('utf-8', errors='replace')
+
 def fetch_with_error_handling(url: str, max_retries: int = 3) -> Tuple[Optional[str], Optional[int]]:
     """
     Fetch URL with comprehensive error handling and retry logic
     """
     for attempt in range(max_retries):
         try:
-            response = requests.get(
+            host_rate_limiter.wait(url)
+            response = get_thread_session().get(
                 url,
-                headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'},
-                timeout=30,
-                allow_redirects=True
+                timeout=config.REQUEST_TIMEOUT,
+                allow_redirects=True,
+                stream=True
             )
-            html = response.text
+            html = read_limited_text(response)
             
             # Check for HTML errors
             if detect_page_errors(html):
@@ -139,7 +226,7 @@ def fetch_with_error_handling(url: str, max_retries: int = 3) -> Tuple[Optional[
                 
     return None, None
 
-@dataclass
+@dataclass(slots=True)
 class LinkInfo:
     """Enhanced structure for storing link information"""
     url: str
@@ -185,40 +272,120 @@ def setup_enhanced_logging():
     )
     return logging.getLogger(__name__)
 
-logger = setup_enhanced_logging()
+# Handlers and the logs/ directory are set up by the entry point, not on import
+logger = logging.getLogger(__name__)
 
-# Thread safety
-THREAD_LOCK = threading.Lock()
-processed_urls = set()
-discovered_links = defaultdict(set)
+def url_fingerprint(url: str) -> bytes:
+    """Compact 16-byte digest identifying a URL for dedup (SHA-256 is hardware-accelerated)"""
+    return hashlib.sha256(url.encode('utf-8', 'surrogatepass')).digest()[:16]
 
 # ============================================================================
 # ENHANCED DATA STRUCTURES
 # ============================================================================
 
-@dataclass
-class LinkInfo:
-    """Enhanced structure for storing link information"""
-    url: str
-    anchor_text: str = ""
-    link_type: str = "internal"       # internal, external, social, contact, maps
-    source_page: str = ""             # Page where link was found
-    depth: int = 0                    # Crawl depth level
-    is_navigation: bool = False       # Navigation menu link
-    is_footer: bool = False           # Footer link
-    is_contact: bool = False          # Contact-related link
-    is_about: bool = False            # About page link
-    is_google_maps: bool = False      # Google Maps link
-    context: str = ""                 # Surrounding context of the link
-    menu_type: str = "body"           # body, header, footer, dropdown, subdropdown
-    css_classes: str = ""             # CSS classes of the link element
+# Precompiled patterns for link extraction
+NAV_ID_RE = re.compile(r'nav|menu', re.I)
+
+# Menu classification patterns
+MENU_CLASS_PATTERNS = {
+    'header': re.compile(r'header|top[-_]?menu|main[-_]?nav|primary[-_]?menu|menu[-_]?primary[-_]?navigation|genesis[-_]?nav[-_]?menu|slideout[-_]?menu[-_]?toggle', re.I),
+    'footer': re.compile(r'footer|bottom[-_]?menu', re.I),
+    'dropdown': re.compile(r'drop[-_]?down|has[-_]?children|sub[-_]?menu|child[-_]?menu', re.I),
+    'subdropdown': re.compile(r'sub[-_]?dropdown|grandchild|sub-sub', re.I),
+    'mobile': re.compile(r'mobile[-_]?menu', re.I),
+    'quicklinks': re.compile(r'quick[-_]?links', re.I)
+}
+
+@lru_cache(maxsize=8192)
+def strip_www(netloc: str) -> str:
+    """Drop a leading 'www.' from a host name"""
+    return netloc[4:] if netloc.startswith('www.') else netloc
+
+def registered_domain(domain: str) -> str:
+    """Reduce a host name to its last two labels (m.facebook.com -> facebook.com)"""
+    return '.'.join(domain.split('.')[-2:])
+
+@lru_cache(maxsize=131072)
+def parse_url_parts(url: str) -> Tuple[str, str, str, str]:
+    """
+    Parse a URL into (scheme, domain without 'www.', path, fragment).
+    Navigation and footer links repeat on every page, so results are memoized.
+    """
+    parsed = urlparse(url)
+    return parsed.scheme, strip_www(parsed.netloc), parsed.path, parsed.fragment
+
+# Query parameters that only track the visit and never change page content
+TRACKING_QUERY_PARAMS = frozenset({
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'fbclid', 'gclid', '_', 'cb'
+})
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+DUPLICATE_SLASHES_RE = re.compile(r'/{2,}')
+
+@lru_cache(maxsize=131072)
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so variants of the same page compare equal: lowercase
+    scheme/host, no default port, fragment or tracking parameters, sorted
+    query, and no duplicate or trailing slashes in the path.
+    """
+    parsed = urlparse(url)
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or '').lower()
+    if ':' in host:
+        host = f"[{host}]"  # IPv6 literal
+    try:
+        port = parsed.port
+    except ValueError:
+        port = None
+    netloc = host if port is None or port == DEFAULT_PORTS.get(scheme) else f"{host}:{port}"
+    path = DUPLICATE_SLASHES_RE.sub('/', parsed.path).rstrip('/') or '/'
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_QUERY_PARAMS
+    ))
+    return urlunparse((scheme, netloc, path, parsed.params, query, ''))
+
+# Link classification keywords, each list fused into one alternation
+LINK_CONTACT_KEYWORDS = ['contact', 'call us', 'call', 'reach us', 'reach', 'email', 'phone', 'tel', 'mail', 'contact us']
+LINK_ABOUT_KEYWORDS = ['about', 'about us', 'about the company', 'about our', 'who we are', 'our story', 'our team', 'about the team']
+LINK_CONTACT_RE = re.compile('|'.join(map(re.escape, LINK_CONTACT_KEYWORDS)), re.I)
+LINK_ABOUT_RE = re.compile('|'.join(map(re.escape, LINK_ABOUT_KEYWORDS)), re.I)
+MAPS_LINK_RE = re.compile(r'google\.com/maps|maps\.google\.com|goo\.gl/maps|maps\.app\.goo\.gl', re.I)
+
+# Elements whose text is used as the surrounding context of a link
+LINK_CONTEXT_TAGS = {'p', 'div', 'li', 'section', 'article', 'main', 'header', 'footer'}
+
+def map_link_ancestry(soup: BeautifulSoup) -> Dict[int, Tuple[bool, bool, Optional[Tag]]]:
+    """
+    Walk the tree once and record, for every <a href> element (keyed by id()),
+    whether it sits inside a nav/menu container, inside a footer, and which
+    context element is its nearest ancestor.
+    """
+    ancestry = {}
+    stack = [(soup, False, False, None)]
+    
+    while stack:
+        node, in_nav, in_footer, context = stack.pop()
+        for child in node.children:
+            if not isinstance(child, Tag):
+                continue
+            
+            if child.name == 'a' and child.has_attr('href'):
+                ancestry[id(child)] = (in_nav, in_footer, context)
+            
+            child_id = child.get('id')
+            child_in_nav = in_nav or child.name == 'nav' or bool(child_id and NAV_ID_RE.search(child_id))
+            child_in_footer = in_footer or child.name == 'footer'
+            child_context = child if child.name in LINK_CONTEXT_TAGS else context
+            stack.append((child, child_in_nav, child_in_footer, child_context))
+    
+    return ancestry
 
 def extract_clickable_links(base_url, html):
-    soup = BeautifulSoup(html, 'html.parser')
-    links = []
+    soup = BeautifulSoup(html, HTML_PARSER)
     
-    parsed_base = urlparse(base_url)
-    base_domain = parsed_base.netloc.replace('www.', '')
+    base_domain = parse_url_parts(base_url)[1]
     
     # Define classification parameters
     SOCIAL_DOMAINS = {
@@ -227,35 +394,19 @@ def extract_clickable_links(base_url, html):
         'snapchat.com', 'whatsapp.com', 't.me', 'weibo.com', 'vk.com'
     }
     
-    def is_maps_link(url):
-        url_lower = url.lower()
-        return ('google.com/maps' in url_lower or
-                'goo.gl/maps' in url_lower or
-                'maps.google.com' in url_lower or
-                'maps.app.goo.gl' in url_lower)
-    
-    contact_keywords = ['contact', 'call us', 'call', 'reach us', 'reach', 'email', 'phone', 'tel', 'mail', 'contact us']
-    about_keywords = ['about', 'about us', 'about the company', 'about our', 'who we are', 'our story', 'our team', 'about the team']
-    
-    # Menu classification patterns
-    menu_class_patterns = {
-        'header': r'header|top[-_]?menu|main[-_]?nav|primary[-_]?menu|menu[-_]?primary[-_]?navigation|genesis[-_]?nav[-_]?menu|slideout[-_]?menu[-_]?toggle',
-        'footer': r'footer|bottom[-_]?menu',
-        'dropdown': r'drop[-_]?down|has[-_]?children|sub[-_]?menu|child[-_]?menu',
-        'subdropdown': r'sub[-_]?dropdown|grandchild|sub-sub',
-        'mobile': r'mobile[-_]?menu',
-        'quicklinks': r'quick[-_]?links'
-    }
+    # Resolve nav/footer/context ancestry for all links in a single tree walk
+    link_ancestry = map_link_ancestry(soup)
     
+    links = []
     for tag in soup.find_all('a', href=True):
         href = tag['href'].strip()
         if not href or href.startswith(('javascript:', 'mailto:', 'tel:')):
             continue
             
         full_url = urljoin(base_url, href)
-        parsed_url = urlparse(full_url)
+        scheme, link_domain, _, _ = parse_url_parts(full_url)
         
-        if parsed_url.scheme not in ['http', 'https']:
+        if scheme not in ['http', 'https']:
             continue
             
         full_url = full_url.split('#')[0]
@@ -268,16 +419,17 @@ def extract_clickable_links(base_url, html):
         is_footer = False
         
         # Check structural elements
-        if tag.find_parent('nav') or tag.find_parent(id=re.compile(r'nav|menu', re.I)):
+        in_nav, in_footer, parent = link_ancestry[id(tag)]
+        if in_nav:
             is_navigation = True
             menu_type = "header"
-        elif tag.find_parent('footer'):
+        elif in_footer:
             is_footer = True
             menu_type = "footer"
         
         # Check class patterns for menu classification
-        for mtype, pattern in menu_class_patterns.items():
-            if re.search(pattern, css_classes, re.I) or re.search(pattern, tag.get('class', ''), re.I):
+        for mtype, pattern in MENU_CLASS_PATTERNS.items():
+            if pattern.search(css_classes):
                 menu_type = mtype
                 if mtype in ['header', 'dropdown', 'subdropdown']:
                     is_navigation = True
@@ -288,8 +440,12 @@ def extract_clickable_links(base_url, html):
         if full_url == base_url or full_url == base_url.rstrip('/') + '/':
             menu_type = "homepage" if menu_type == "body" else menu_type
         
+        # Set special flags
+        is_contact = bool(LINK_CONTACT_RE.search(full_url) or LINK_CONTACT_RE.search(anchor_text))
+        is_about = bool(LINK_ABOUT_RE.search(full_url) or LINK_ABOUT_RE.search(anchor_text))
+        is_google_maps = bool(MAPS_LINK_RE.search(full_url))
+        
         # Determine link type
-        link_domain = parsed_url.netloc.replace('www.', '')
         same_domain = base_domain == link_domain
         
         if same_domain:
@@ -297,31 +453,21 @@ def extract_clickable_links(base_url, html):
         else:
             if link_domain in SOCIAL_DOMAINS:
                 link_type = 'social'
-            elif is_maps_link(full_url):
+            elif is_google_maps:
                 link_type = 'maps'
+            elif is_contact:
+                link_type = 'contact'
             else:
-                url_lower = full_url.lower()
-                anchor_lower = anchor_text.lower()
-                if any(kw in url_lower or kw in anchor_lower for kw in contact_keywords):
-                    link_type = 'contact'
-                else:
-                    link_type = 'external'
-        
-        # Set special flags
-        url_lower = full_url.lower()
-        anchor_lower = anchor_text.lower()
-        is_contact = any(kw in url_lower or kw in anchor_lower for kw in contact_keywords)
-        is_about = any(kw in url_lower or kw in anchor_lower for kw in about_keywords)
-        is_google_maps = is_maps_link(full_url)
+                link_type = 'external'
         
         # Extract context from parent elements
         context = ""
-        context_elements = tag.find_parents(['p', 'div', 'li', 'section', 'article', 'main', 'header', 'footer'])
-        if context_elements:
+        if parent is not None:
             # Get the immediate parent context
-            parent = context_elements[0]
             context = parent.get_text(" ", strip=True)
-            context = re.sub(r'\s+', ' ', context)[:500] + '...' if len(context) > 500 else context
+            # Truncate first so whitespace normalization only touches the kept prefix
+            truncated = len(context) > 500
+            context = ' '.join(context[:500].split()) + ('...' if truncated else '')
         
         # Create link info object
         link_info = LinkInfo(
@@ -344,20 +490,20 @@ def extract_clickable_links(base_url, html):
     
     return links
 
-@dataclass
+@dataclass(slots=True)
 class GoogleMapsInfo:
     """Structure for storing Google Maps information"""
-    maps_links: List[str] = field(default_factory=list)
-    iframe_embeds: List[str] = field(default_factory=list)
-    javascript_maps: List[str] = field(default_factory=list)
-    structured_data_maps: List[str] = field(default_factory=list)
-    contact_page_maps: List[str] = field(default_factory=list)
+    maps_links: Set[str] = field(default_factory=set)
+    iframe_embeds: Set[str] = field(default_factory=set)
+    javascript_maps: Set[str] = field(default_factory=set)
+    structured_data_maps: Set[str] = field(default_factory=set)
+    contact_page_maps: Set[str] = field(default_factory=set)
     all_maps_links: List[str] = field(default_factory=list)
     primary_maps_link: str = ""
     maps_integration_status: str = "Not Found"
     total_maps_found: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class SiteMap:
     """Enhanced structure for complete website mapping"""
     domain: str
@@ -368,13 +514,14 @@ class SiteMap:
     external_links: List[LinkInfo] = field(default_factory=list)
     social_links: List[LinkInfo] = field(default_factory=list)
     contact_links: List[LinkInfo] = field(default_factory=list)
+    social_links_by_platform: Dict[str, str] = field(default_factory=dict)  # First link seen per platform
     google_maps_info: GoogleMapsInfo = field(default_factory=GoogleMapsInfo)
     crawl_depth_reached: int = 0
     page_types: Dict[str, List[str]] = field(default_factory=dict)
     navigation_structure: Dict[str, List[str]] = field(default_factory=dict)
     website_structure_complexity: str = "Unknown"
 
-@dataclass
+@dataclass(slots=True)
 class ContactInfo:
     """Enhanced structure for storing contact information"""
     brand_name: Optional[str] = None
@@ -397,8 +544,13 @@ class ContactInfo:
                 'facebook': None, 'instagram': None, 'tiktok': None,
                 'linkedin': None, 'twitter': None, 'pinterest': None, 'youtube': None
             }
+    
+    @property
+    def active_social_count(self) -> int:
+        """Number of social platforms with a profile URL"""
+        return sum(1 for url in self.social_media.values() if url)
 
-@dataclass
+@dataclass(slots=True)
 class EnhancedMetadata:
     """Enhanced structure for storing website metadata"""
     site_title: Optional[str] = None
@@ -411,7 +563,7 @@ class EnhancedMetadata:
     all_page_titles: List[str] = field(default_factory=list)
     keywords_compilation: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class BusinessMetrics:
     """Enhanced structure for storing business metrics"""
     industry: str = "Unknown"
@@ -425,7 +577,7 @@ class BusinessMetrics:
     digital_presence_strength: str = "Unknown"
     contact_accessibility: str = "Unknown"
 
-@dataclass
+@dataclass(slots=True)
 class MarketingIntelligence:
     """Enhanced structure for storing marketing intelligence"""
     instagram_handle: Optional[str] = None
@@ -435,7 +587,7 @@ class MarketingIntelligence:
     ad_library_proof: List[str] = field(default_factory=list)
     social_media_engagement: Dict[str, int] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class WebsiteFeatures:
     """Enhanced structure for storing website features"""
     d2c_presence: bool = False
@@ -451,7 +603,7 @@ class WebsiteFeatures:
     contact_forms: bool = False
     newsletter_signup: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class PageMetadata:
     """Enhanced structure for storing individual page metadata"""
     url: str
@@ -470,21 +622,130 @@ class PageMetadata:
     depth: int = 0
     links_found: List[LinkInfo] = field(default_factory=list)
     google_maps_found: List[str] = field(default_factory=list)
+    soup: Optional[BeautifulSoup] = field(default=None, repr=False, compare=False)  # Parsed tree reused by later passes
+    maps_by_method: Dict[str, List[str]] = field(default_factory=dict, repr=False, compare=False)  # Maps links per detection method
+    soup_cache: Optional['PageSoupCache'] = field(default=None, repr=False, compare=False)  # Bounds the site's live trees
+
+class PageSoupCache:
+    """
+    Bounds how many pages of one site hold a parsed tree. Past maxsize, the
+    least recently used page's tree is dropped and get_page_soup re-parses its
+    HTML on demand. A tree costs many times its page's HTML in memory.
+    """
+    
+    def __init__(self, maxsize: int = config.SOUP_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._pages = OrderedDict()  # id(page) -> page; the reference keeps the id unique
+        self._lock = threading.Lock()
+    
+    def touch(self, page: PageMetadata):
+        """Mark page's tree as most recently used, evicting older trees past maxsize"""
+        with self._lock:
+            self._pages[id(page)] = page
+            self._pages.move_to_end(id(page))
+            while len(self._pages) > self.maxsize:
+                _, evicted = self._pages.popitem(last=False)
+                evicted.soup = None
+    
+    def clear(self):
+        """Drop every tree still held, once the site's analysis is done"""
+        with self._lock:
+            for page in self._pages.values():
+                page.soup = None
+            self._pages.clear()
+
+def get_page_soup(page: PageMetadata) -> BeautifulSoup:
+    """Return the page's parsed tree, parsing it on first use or after eviction"""
+    soup = page.soup  # Read once: another thread may evict it meanwhile
+    if soup is None:
+        soup = page.soup = BeautifulSoup(page.html, HTML_PARSER)
+    if page.soup_cache is not None:
+        page.soup_cache.touch(page)
+    return soup
+
+@dataclass(slots=True)
+class ExtractionContext:
+    """
+    Per-page text shared by the extractors, lowercased once per analysis.
+    Pages are scanned one at a time, so the site corpus is never joined into one string.
+    """
+    texts: List[str]
+    texts_lower: List[str]
+    word_counts: np.ndarray
+    content_key: bytes  # Digest of all page texts, for reusing results on unchanged sites
+    
+    @classmethod
+    def from_pages(cls, pages_data: List[PageMetadata]) -> 'ExtractionContext':
+        texts = [page.text_content or "" for page in pages_data]
+        texts_lower = [text.lower() for text in texts]
+        word_counts = np.fromiter((page.word_count for page in pages_data), dtype=np.int64, count=len(pages_data))
+        digest = hashlib.blake2b(digest_size=16)
+        for text in texts:
+            digest.update(text.encode('utf-8', 'surrogatepass'))
+            digest.update(b'\0')
+        return cls(texts=texts, texts_lower=texts_lower,
+                   word_counts=word_counts, content_key=digest.digest())
+    
+    def contains_any(self, keywords: List[str]) -> bool:
+        """Whether any keyword occurs in any page's lowercased text"""
+        return any(keyword in text for text in self.texts_lower for keyword in keywords)
+
+class BoundedCache:
+    """Thread-safe least-recently-used mapping with a fixed capacity"""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key) -> Any:
+        """Cached value for key, or None"""
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+    
+    def put(self, key, value):
+        """Store value, evicting the least recently used entry past maxsize"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+def first_match(pattern: re.Pattern, texts: List[str]) -> Optional[re.Match]:
+    """First match of pattern across texts, in page order"""
+    for text in texts:
+        match = pattern.search(text)
+        if match:
+            return match
+    return None
 
 # ============================================================================
 # ENHANCED GOOGLE MAPS DETECTOR
 # ============================================================================
 
+# schema.org PostalAddress keys used to build a maps search query, in order
+JSONLD_ADDRESS_KEYS = ('streetAddress', 'addressLocality', 'addressRegion', 'postalCode')
+
+# Host fragment every maps URL pattern contains, used to skip unrelated scripts cheaply
+MAPS_SCRIPT_HINT_RE = re.compile(r'google\.com|goo\.gl', re.IGNORECASE)
+
 class EnhancedGoogleMapsDetector:
     """Comprehensive Google Maps detection with multiple methods"""
     
     def __init__(self):
         self.maps_patterns = [
-            r'https?://(?:www\.)?google\.com/maps[^\s"\'<>]*',
-            r'https?://(?:www\.)?maps\.google\.com[^\s"\'<>]*',
-            r'https?://goo\.gl/maps/[^\s"\'<>]*',
-            r'https?://maps\.app\.goo\.gl/[^\s"\'<>]*'
+            re.compile(r'https?://(?:www\.)?google\.com/maps[^\s"\'<>]*', re.IGNORECASE),
+            re.compile(r'https?://(?:www\.)?maps\.google\.com[^\s"\'<>]*', re.IGNORECASE),
+            re.compile(r'https?://goo\.gl/maps/[^\s"\'<>]*', re.IGNORECASE),
+            re.compile(r'https?://maps\.app\.goo\.gl/[^\s"\'<>]*', re.IGNORECASE)
         ]
+        # All maps URL patterns fused into one scan; the lookahead keeps URLs nested inside another match
+        self.maps_url_re = re.compile(
+            '(?=(' + '|'.join(pattern.pattern for pattern in self.maps_patterns) + '))', re.IGNORECASE
+        )
         
         self.maps_keywords = [
             'google maps', 'google map', 'maps.google.com', 'google.com/maps',
@@ -502,43 +763,25 @@ class EnhancedGoogleMapsDetector:
             if not page.html:
                 continue
             
-            soup = BeautifulSoup(page.html, 'html.parser')
+            # Pages normally arrive already scanned during page analysis
+            if not page.maps_by_method:
+                self.analyze_page(page)
             
-            # Method 1: Direct link detection
-            direct_links = self._detect_direct_links(soup, page.url)
-            maps_info.maps_links.extend(direct_links)
-            all_maps_found.update(direct_links)
-            
-            # Method 2: Iframe embed detection
-            iframe_embeds = self._detect_iframe_embeds(soup, page.url)
-            maps_info.iframe_embeds.extend(iframe_embeds)
-            all_maps_found.update(iframe_embeds)
-            
-            # Method 3: JavaScript detection
-            js_maps = self._detect_javascript_maps(soup, page.url)
-            maps_info.javascript_maps.extend(js_maps)
-            all_maps_found.update(js_maps)
-            
-            # Method 4: Structured data detection
-            structured_maps = self._detect_structured_data_maps(page.json_ld, page.url)
-            maps_info.structured_data_maps.extend(structured_maps)
-            all_maps_found.update(structured_maps)
-            
-            # Store maps found on this page
-            page.google_maps_found = list(all_maps_found)
+            for method, found in page.maps_by_method.items():
+                getattr(maps_info, method).update(found)
+            all_maps_found.update(page.google_maps_found)
             
             # Special handling for contact pages
             if page.is_contact_page or 'contact' in page.url.lower():
-                contact_maps = list(all_maps_found)
-                maps_info.contact_page_maps.extend(contact_maps)
+                maps_info.contact_page_maps.update(page.google_maps_found)
         
         # Compile all unique maps
-        maps_info.all_maps_links = list(all_maps_found)
+        maps_info.all_maps_links = sorted(all_maps_found)
         maps_info.total_maps_found = len(all_maps_found)
         
         # Determine primary maps link and integration status
         if all_maps_found:
-            maps_info.primary_maps_link = self._select_primary_maps_link(list(all_maps_found))
+            maps_info.primary_maps_link = self._select_primary_maps_link(maps_info.all_maps_links)
             maps_info.maps_integration_status = "Integrated"
         else:
             maps_info.maps_integration_status = "Not Found"
@@ -546,6 +789,23 @@ class EnhancedGoogleMapsDetector:
         logger.info(f"Google Maps detection completed. Found {maps_info.total_maps_found} maps links")
         return maps_info
     
+    def analyze_page(self, page: PageMetadata, soup: Optional[BeautifulSoup] = None) -> None:
+        """Run every maps detection method against one page's parsed tree"""
+        if soup is None:
+            soup = get_page_soup(page)
+        
+        page.maps_by_method = {
+            'maps_links': self._detect_direct_links(soup, page.url),
+            'iframe_embeds': self._detect_iframe_embeds(soup, page.url),
+            'javascript_maps': self._detect_javascript_maps(soup, page.url),
+            'structured_data_maps': self._detect_structured_data_maps(page.json_ld, page.url),
+        }
+        
+        # Store maps found on this page
+        page.google_maps_found = list(dict.fromkeys(
+            url for found in page.maps_by_method.values() for url in found
+        ))
+    
     def _detect_direct_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """Detect direct Google Maps links"""
         maps_links = []
@@ -584,18 +844,17 @@ class EnhancedGoogleMapsDetector:
         js_maps = []
         
         for script in soup.find_all('script'):
-            if script.string:
+            # Most scripts are bundles with no maps references; skip them before the full scan
+            if script.string and MAPS_SCRIPT_HINT_RE.search(script.string):
                 script_content = script.string
                 
                 # Look for Google Maps URLs in JavaScript
-                for pattern in self.maps_patterns:
-                    matches = re.findall(pattern, script_content, re.IGNORECASE)
-                    for match in matches:
-                        # Clean up the URL
-                        clean_url = match.strip('\'"')
-                        if clean_url not in js_maps:
-                            js_maps.append(clean_url)
-                            logger.debug(f"Found Google Maps in JavaScript: {clean_url}")
+                for match in self.maps_url_re.findall(script_content):
+                    # Clean up the URL
+                    clean_url = match.strip('\'"')
+                    if clean_url not in js_maps:
+                        js_maps.append(clean_url)
+                        logger.debug(f"Found Google Maps in JavaScript: {clean_url}")
         
         return js_maps
     
@@ -623,29 +882,18 @@ class EnhancedGoogleMapsDetector:
             return data['hasMap']
         
         # Look for location with coordinates
-        if 'location' in data:
-            location = data['location']
-            if isinstance(location, dict):
-                if 'geo' in location:
-                    geo = location['geo']
-                    if isinstance(geo, dict) and 'latitude' in geo and 'longitude' in geo:
-                        lat = geo['latitude']
-                        lng = geo['longitude']
-                        return f"https://www.google.com/maps?q={lat},{lng}"
+        location = data.get('location')
+        geo = location.get('geo') if isinstance(location, dict) else None
+        if isinstance(geo, dict) and 'latitude' in geo and 'longitude' in geo:
+            return f"https://www.google.com/maps?q={geo['latitude']},{geo['longitude']}"
         
         # Look for address
-        if 'address' in data:
-            address = data['address']
-            if isinstance(address, dict):
-                address_parts = []
-                for key in ['streetAddress', 'addressLocality', 'addressRegion', 'postalCode']:
-                    if key in address:
-                        address_parts.append(str(address[key]))
-                
-                if address_parts:
-                    address_string = ', '.join(address_parts)
-                    encoded_address = address_string.replace(' ', '+')
-                    return f"https://www.google.com/maps/search/{encoded_address}"
+        address = data.get('address')
+        if isinstance(address, dict):
+            address_parts = [str(address[key]) for key in JSONLD_ADDRESS_KEYS if key in address]
+            if address_parts:
+                encoded_address = quote_plus(', '.join(address_parts), safe=',')
+                return f"https://www.google.com/maps/search/{encoded_address}"
         
         return None
     
@@ -676,75 +924,105 @@ class EnhancedGoogleMapsDetector:
 # COMPREHENSIVE LINK DISCOVERER
 # ============================================================================
 
+# Class/id fragments marking navigation and footer containers
+NAV_INDICATOR_RE = re.compile(r'nav|menu|header', re.I)
+FOOTER_INDICATOR_RE = re.compile(r'footer|bottom|copyright', re.I)
+
+# Social media domains and the platform each belongs to
+SOCIAL_PLATFORMS = {
+    'facebook.com': 'facebook',
+    'instagram.com': 'instagram',
+    'tiktok.com': 'tiktok',
+    'linkedin.com': 'linkedin',
+    'twitter.com': 'twitter',
+    'x.com': 'twitter',
+    'pinterest.com': 'pinterest',
+    'youtube.com': 'youtube'
+}
+
 class ComprehensiveLinkDiscoverer:
     """Discovers ALL clickable links across entire website"""
     
     def __init__(self, http_client):
         self.http_client = http_client
-        self.discovered_urls = set()
+        self.discovered_urls = set()  # Fingerprints of canonical URLs already queued
         self.url_queue = deque()
         self.link_relationships = defaultdict(list)
         
         # Link classification patterns
-        self.social_domains = [
+        self.social_domains = {
             'facebook.com', 'instagram.com', 'twitter.com', 'x.com',
             'linkedin.com', 'youtube.com', 'tiktok.com', 'pinterest.com'
-        ]
+        }
         
         self.contact_keywords = [
             'contact', 'about', 'team', 'staff', 'location', 'office',
             'reach', 'touch', 'support', 'help', 'customer-service'
         ]
+        self.contact_keyword_re = re.compile('|'.join(map(re.escape, self.contact_keywords)))
         
         self.excluded_extensions = [
             '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
             '.zip', '.rar', '.tar', '.gz', '.jpg', '.jpeg', '.png',
             '.gif', '.webp', '.svg', '.mp4', '.avi', '.mov', '.mp3'
         ]
+        self.excluded_ext_tuple = tuple(self.excluded_extensions)
     
     def discover_all_links(self, main_url: str) -> SiteMap:
         """Discover ALL links across entire website with comprehensive mapping"""
         logger.info(f"Starting comprehensive link discovery for: {main_url}")
         
-        domain = urlparse(main_url).netloc.replace("www.", "")
+        domain = parse_url_parts(main_url)[1]
         sitemap = SiteMap(domain=domain, main_url=main_url)
         
+        if not robots_allows(main_url):
+            logger.warning(f"robots.txt disallows {main_url}; skipping link discovery")
+            return sitemap
+        
         # Initialize with main URL
         self.url_queue.append((main_url, 0))  # (url, depth)
-        self.discovered_urls.add(main_url)
-        
-        # Comprehensive crawling with depth control
-        while self.url_queue and len(self.discovered_urls) < config.MAX_PAGES_PER_SITE:
-            current_url, depth = self.url_queue.popleft()
-            
-            if depth > config.MAX_CRAWL_DEPTH:
-                continue
-            
-            logger.info(f"Discovering links from: {current_url} (depth: {depth})")
-            
-            # Get page content
-            html, status_code = self.http_client.get_with_retry(current_url)
-            if not html:
-                continue
-            
-            # Extract all links from current page
-            page_links = self._extract_all_links_from_page(html, current_url, depth)
-            
-            # Process and classify links
-            for link_info in page_links:
-                self._classify_and_store_link(link_info, sitemap)
+        self.discovered_urls.add(url_fingerprint(canonicalize_url(main_url)))
+        
+        # Comprehensive crawling with depth control. Queued pages are fetched
+        # concurrently in batches, then processed in queue order as before.
+        with ThreadPoolExecutor(max_workers=config.MAX_CRAWL_WORKERS) as executor:
+            while self.url_queue and len(self.discovered_urls) < config.MAX_PAGES_PER_SITE:
+                batch = []
+                while self.url_queue and len(batch) < config.MAX_CRAWL_WORKERS:
+                    current_url, depth = self.url_queue.popleft()
+                    if depth <= config.MAX_CRAWL_DEPTH:
+                        batch.append((current_url, depth))
+                
+                # Get page content
+                responses = executor.map(self.http_client.get_with_retry, [url for url, _ in batch])
                 
-                # Add internal links to queue for further crawling
-                if (link_info.link_type == "internal" and 
-                    link_info.url not in self.discovered_urls and
-                    depth < config.MAX_CRAWL_DEPTH):
+                for (current_url, depth), (html, status_code) in zip(batch, responses):
+                    if len(self.discovered_urls) >= config.MAX_PAGES_PER_SITE:
+                        break
                     
-                    self.url_queue.append((link_info.url, depth + 1))
-                    self.discovered_urls.add(link_info.url)
-            
-            # Update sitemap statistics
-            sitemap.total_links += len(page_links)
-            sitemap.crawl_depth_reached = max(sitemap.crawl_depth_reached, depth)
+                    logger.info(f"Discovering links from: {current_url} (depth: {depth})")
+                    if not html:
+                        continue
+                    
+                    # Extract all links from current page
+                    page_links = self._extract_all_links_from_page(html, current_url, depth)
+                    
+                    # Process and classify links
+                    for link_info in page_links:
+                        self._classify_and_store_link(link_info, sitemap)
+                        
+                        # Add internal links to queue for further crawling, once per canonical
+                        # URL and only where robots.txt allows fetching. The canonical form is
+                        # only the dedup key; the URL fetched is the one the site linked.
+                        if link_info.link_type == "internal" and depth < config.MAX_CRAWL_DEPTH:
+                            fingerprint = url_fingerprint(canonicalize_url(link_info.url))
+                            if fingerprint not in self.discovered_urls and robots_allows(link_info.url):
+                                self.url_queue.append((link_info.url, depth + 1))
+                                self.discovered_urls.add(fingerprint)
+                    
+                    # Update sitemap statistics
+                    sitemap.total_links += len(page_links)
+                    sitemap.crawl_depth_reached = max(sitemap.crawl_depth_reached, depth)
         
         # Finalize sitemap
         sitemap.total_pages = len(self.discovered_urls)
@@ -755,8 +1033,10 @@ class ComprehensiveLinkDiscoverer:
     
     def _extract_all_links_from_page(self, html: str, base_url: str, depth: int) -> List[LinkInfo]:
         """Extract ALL links from a single page with comprehensive analysis"""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER)
         links = []
+        link_regions = self._map_link_regions(soup)
+        context_cache = {}  # id(parent) -> context text, shared by sibling anchors
         
         # Extract all anchor tags
         for a in soup.find_all('a', href=True):
@@ -771,7 +1051,7 @@ class ComprehensiveLinkDiscoverer:
             full_url = urljoin(base_url, href)
             
             # Skip excluded file types
-            if any(full_url.lower().endswith(ext) for ext in self.excluded_extensions):
+            if full_url.lower().endswith(self.excluded_ext_tuple):
                 continue
             
             # Create link info
@@ -780,12 +1060,11 @@ class ComprehensiveLinkDiscoverer:
                 anchor_text=anchor_text,
                 source_page=base_url,
                 depth=depth + 1,
-                context=self._get_link_context(a)
+                context=self._get_link_context(a, context_cache)
             )
             
             # Determine link location context
-            link_info.is_navigation = self._is_navigation_link(a)
-            link_info.is_footer = self._is_footer_link(a)
+            link_info.is_navigation, link_info.is_footer = link_regions[id(a)]
             
             links.append(link_info)
         
@@ -793,9 +1072,10 @@ class ComprehensiveLinkDiscoverer:
     
     def _classify_and_store_link(self, link_info: LinkInfo, sitemap: SiteMap):
         """Classify link and store in appropriate sitemap category"""
-        parsed_url = urlparse(link_info.url)
-        base_domain = urlparse(sitemap.main_url).netloc.replace("www.", "")
-        link_domain = parsed_url.netloc.replace("www.", "")
+        # Both lookups are memoized, so the site's own domain is parsed once per crawl
+        base_domain = parse_url_parts(sitemap.main_url)[1]
+        link_domain = parse_url_parts(link_info.url)[1]
+        link_base_domain = registered_domain(link_domain)
         
         # Classify link type
         if link_domain == base_domain:
@@ -804,82 +1084,77 @@ class ComprehensiveLinkDiscoverer:
             
             # Check for special page types
             url_lower = link_info.url.lower()
-            if any(keyword in url_lower for keyword in self.contact_keywords):
+            if self.contact_keyword_re.search(url_lower):
                 link_info.is_contact = True
                 sitemap.contact_links.append(link_info)
             
             if 'about' in url_lower:
                 link_info.is_about = True
         
-        elif any(social in link_domain for social in self.social_domains):
+        elif link_base_domain in self.social_domains:
             link_info.link_type = "social"
             sitemap.social_links.append(link_info)
+            
+            # Record the first link per platform for contact extraction
+            clean_url = link_info.url.split('?')[0].rstrip('/')
+            sitemap.social_links_by_platform.setdefault(SOCIAL_PLATFORMS[link_base_domain], clean_url)
         
         elif 'maps.google.com' in link_info.url or 'google.com/maps' in link_info.url:
             link_info.link_type = "maps"
             link_info.is_google_maps = True
-            sitemap.google_maps_info.maps_links.append(link_info.url)
+            sitemap.google_maps_info.maps_links.add(link_info.url)
         
         else:
             link_info.link_type = "external"
             sitemap.external_links.append(link_info)
     
-    def _get_link_context(self, a_tag) -> str:
-        """Get surrounding context of the link"""
+    def _get_link_context(self, a_tag, context_cache: Dict[int, str]) -> str:
+        """Get surrounding context of the link, extracting each parent's text once per page"""
         parent = a_tag.parent
         if parent:
-            context = parent.get_text(strip=True)
-            return context[:100]  # Limit context length
+            key = id(parent)
+            if key not in context_cache:
+                context_cache[key] = parent.get_text(strip=True)[:100]  # Limit context length
+            return context_cache[key]
         return ""
     
-    def _is_navigation_link(self, a_tag) -> bool:
-        """Determine if link is in navigation"""
-        nav_indicators = ['nav', 'menu', 'header', 'navbar', 'navigation']
-        
-        # Check parent elements
-        current = a_tag.parent
-        for _ in range(5):  # Check up to 5 levels up
-            if current is None:
-                break
-            
-            # Check class and id attributes
-            classes = current.get('class', [])
-            id_attr = current.get('id', '')
-            
-            if any(indicator in ' '.join(classes).lower() for indicator in nav_indicators):
-                return True
-            if any(indicator in id_attr.lower() for indicator in nav_indicators):
-                return True
-            
-            current = current.parent
-        
-        return False
-    
-    def _is_footer_link(self, a_tag) -> bool:
-        """Determine if link is in footer"""
-        footer_indicators = ['footer', 'bottom', 'copyright']
-        
-        # Check parent elements
-        current = a_tag.parent
-        for _ in range(5):  # Check up to 5 levels up
-            if current is None:
-                break
-            
-            if current.name == 'footer':
-                return True
-            
-            # Check class and id attributes
-            classes = current.get('class', [])
-            id_attr = current.get('id', '')
-            
-            if any(indicator in ' '.join(classes).lower() for indicator in footer_indicators):
-                return True
-            if any(indicator in id_attr.lower() for indicator in footer_indicators):
-                return True
-            
-            current = current.parent
+    def _map_link_regions(self, soup: BeautifulSoup) -> Dict[int, Tuple[bool, bool]]:
+        """
+        Walk the tree once and record, for every <a href> (keyed by id()), whether
+        a navigation or footer container sits within 5 ancestor levels of it.
+        """
+        regions = {}
+        # Levels from each node up to its nearest marked ancestor-or-self (None if none)
+        stack = [(soup, None, None)]
+        
+        while stack:
+            node, nav_dist, footer_dist = stack.pop()
+            for child in node.children:
+                if not isinstance(child, Tag):
+                    continue
+                
+                if child.name == 'a' and child.has_attr('href'):
+                    # The parent is 1 level up, so its distance may be at most 4
+                    regions[id(child)] = (nav_dist is not None and nav_dist <= 4,
+                                          footer_dist is not None and footer_dist <= 4)
+                
+                classes = ' '.join(child.get('class', []))
+                id_attr = child.get('id', '')
+                
+                if NAV_INDICATOR_RE.search(classes) or NAV_INDICATOR_RE.search(id_attr):
+                    child_nav = 0
+                else:
+                    child_nav = None if nav_dist is None else nav_dist + 1
+                
+                if (child.name == 'footer' or FOOTER_INDICATOR_RE.search(classes)
+                        or FOOTER_INDICATOR_RE.search(id_attr)):
+                    child_footer = 0
+                else:
+                    child_footer = None if footer_dist is None else footer_dist + 1
+                
+                stack.append((child, child_nav, child_footer))
         
-        return False
+        return regions
     
     def _assess_website_complexity(self, sitemap: SiteMap) -> str:
         """Assess website structure complexity"""
@@ -908,12 +1183,12 @@ class EnhancedWebDriverManager:
         """Get optimized Chrome driver instance with enhanced settings"""
         if self.driver is None:
             options = Options()
-            options.add_argument('--headless')
+            options.page_load_strategy = 'eager'  # Return on DOMContentLoaded, not after every subresource
+            options.add_argument('--headless=new')
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-dev-shm-usage')
             options.add_argument('--disable-gpu')
             options.add_argument('--disable-images')
-            options.add_argument('--disable-javascript')  # Disable JS for faster loading
             options.add_argument(f'--user-agent={config.USER_AGENT}')
             options.add_argument('--window-size=1920,1080')
             options.add_argument('--disable-blink-features=AutomationControlled')
@@ -935,6 +1210,16 @@ class EnhancedWebDriverManager:
                     options=options
                 )
                 self.driver.set_page_load_timeout(config.SELENIUM_TIMEOUT)
+                
+                # Only the rendered DOM is needed, so skip images, stylesheets and fonts
+                try:
+                    self.driver.execute_cdp_cmd('Network.enable', {})
+                    self.driver.execute_cdp_cmd('Network.setBlockedURLs', {
+                        'urls': ['*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.svg', '*.css', '*.woff*', '*.ttf']
+                    })
+                except Exception as e:
+                    logger.debug(f"Could not block subresources: {e}")
+                
                 logger.info("Enhanced Chrome driver initialized successfully")
             except Exception as e:
                 logger.error(f"Failed to initialize Chrome driver: {e}")
@@ -953,10 +1238,96 @@ class EnhancedWebDriverManager:
             finally:
                 self.driver = None
 
+class EnhancedWebDriverPool:
+    """Bounded pool of reusable Chrome drivers shared across page workers"""
+    
+    def __init__(self, size: int = config.SELENIUM_POOL_SIZE):
+        self._managers = [EnhancedWebDriverManager() for _ in range(size)]
+        self._available = queue.Queue()
+        for manager in self._managers:
+            self._available.put(manager)
+    
+    @contextmanager
+    def acquire(self):
+        """Borrow a driver, starting Chrome lazily on its first use"""
+        manager = self._available.get()
+        try:
+            yield manager.get_driver()
+        finally:
+            self._available.put(manager)
+    
+    def quit(self):
+        """Quit every driver the pool started"""
+        for manager in self._managers:
+            manager.quit()
+
 # ============================================================================
 # HTTP CLIENT (Enhanced)
 # ============================================================================
 
+@lru_cache(maxsize=1024)
+def get_robots_parser(origin: str) -> Optional[RobotFileParser]:
+    """Fetch and parse robots.txt for a scheme://host origin, once per host"""
+    try:
+        response = get_thread_session().get(f"{origin}/robots.txt", timeout=config.ROBOTS_TIMEOUT)
+    except requests.exceptions.RequestException as e:
+        logger.debug(f"robots.txt unavailable for {origin}: {e}")
+        return None
+    parser = RobotFileParser(f"{origin}/robots.txt")
+    if response.status_code in (401, 403):
+        # Same as urllib.robotparser: an access-controlled robots.txt disallows everything
+        parser.disallow_all = True
+        return parser
+    if response.status_code != 200:
+        return None
+    parser.parse(response.text.splitlines())
+    return parser
+
+def url_origin(url: str) -> str:
+    """scheme://host[:port] part of a URL, the key for per-host robots and rate limits"""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+def robots_allows(url: str) -> bool:
+    """Whether robots.txt permits our user agent to fetch url (True when there is none)"""
+    robots = get_robots_parser(url_origin(url))
+    return robots is None or robots.can_fetch(config.USER_AGENT, url)
+
+class HostRateLimiter:
+    """
+    Per-host politeness: spaces requests to one host by its robots.txt
+    Crawl-delay (or REQUESTS_PER_SECOND), reserving the next slot under a lock
+    and sleeping outside it so other hosts and workers are never blocked.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next_slot = {}  # origin -> earliest monotonic time for the next request
+    
+    def _interval(self, origin: str) -> float:
+        interval = 1.0 / config.REQUESTS_PER_SECOND
+        robots = get_robots_parser(origin)
+        if robots is not None:
+            crawl_delay = robots.crawl_delay(config.USER_AGENT)
+            if crawl_delay:
+                interval = max(interval, float(crawl_delay))
+        return interval
+    
+    def wait(self, url: str):
+        """Block the calling thread until its request to url's host may be sent"""
+        origin = url_origin(url)
+        interval = self._interval(origin)
+        
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(origin, now))
+            self._next_slot[origin] = slot + interval
+        
+        if slot > now:
+            time.sleep(slot - now)
+
+host_rate_limiter = HostRateLimiter()
+
 class EnhancedHTTPClient:
     """Enhanced HTTP client with better retry logic and session management"""
     
@@ -966,24 +1337,32 @@ class EnhancedHTTPClient:
             'User-Agent': config.USER_AGENT,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': requests.utils.DEFAULT_ACCEPT_ENCODING,  # Includes br when brotli is installed
             'Connection': 'keep-alive',
         })
         
+        # Keep a warm pool of persistent connections; retries are handled in get_with_retry
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
     def get_with_retry(self, url: str, retries: int = config.MAX_RETRIES) -> Tuple[Optional[str], Optional[int]]:
         """Enhanced GET with retry logic and better error handling"""
         for attempt in range(retries):
             try:
                 logger.debug(f"HTTP attempt {attempt + 1} for {url}")
+                host_rate_limiter.wait(url)
                 response = self.session.get(
                     url, 
                     timeout=config.REQUEST_TIMEOUT,
-                    allow_redirects=True
+                    allow_redirects=True,
+                    stream=True
                 )
+                html = read_limited_text(response)
                 
-                if response.status_code == 200 and len(response.text) > config.MIN_HTML_LENGTH:
+                if response.status_code == 200 and len(html) > config.MIN_HTML_LENGTH:
                     logger.debug(f"HTTP success for {url}")
-                    return response.text, response.status_code
+                    return html, response.status_code
                 elif response.status_code in [403, 404, 500, 503]:
                     logger.warning(f"HTTP error {response.status_code} for {url}")
                     return None, response.status_code
@@ -996,10 +1375,71 @@ class EnhancedHTTPClient:
         logger.error(f"All HTTP attempts failed for {url}")
         return None, None
 
+class ImageDownloader:
+    """
+    One site's image downloads on a single bounded pool. Each file name is
+    reserved under a lock before its download is queued, so an image shared by
+    many pages is fetched once and no two downloads write the same file.
+    """
+    
+    def __init__(self, max_workers: int = config.IMAGE_DOWNLOAD_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self._reserved = set()  # Paths already queued for this site
+        self._futures = []
+    
+    def submit(self, img_url: str, path: Path):
+        """Queue img_url for download to path, unless path is taken or already on disk"""
+        with self._lock:
+            if path in self._reserved:
+                return
+            self._reserved.add(path)
+        if not path.exists():
+            future = self._pool.submit(self._download, img_url, path)
+            with self._lock:
+                self._futures.append(future)
+    
+    def shutdown(self):
+        """Wait for every queued download to finish, logging any that raised"""
+        self._pool.shutdown(wait=True)
+        with self._lock:
+            futures, self._futures = self._futures, []
+        for future in futures:
+            error = future.exception()
+            if error is not None:
+                logger.warning(f"Image download failed: {error}")
+    
+    def _download(self, img_url: str, path: Path):
+        """
+        Stream one image to path through a fixed-size buffer. The body goes to
+        a temporary file of its own first, so a failed transfer never leaves a
+        truncated image.
+        """
+        part_path = None
+        try:
+            host_rate_limiter.wait(img_url)
+            with get_thread_session().get(img_url, timeout=5, stream=True, headers={'Accept': 'image/*'}) as response:
+                content_type = response.headers.get('Content-Type', '')
+                if response.status_code != 200 or (content_type and not content_type.startswith('image/')):
+                    return
+                response.raw.decode_content = True
+                with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name, suffix='.part', delete=False) as f:
+                    part_path = f.name
+                    shutil.copyfileobj(response.raw, f, length=65536)
+            os.replace(part_path, path)
+        except Exception as e:
+            logger.debug(f"Failed to download image {img_url}: {e}")
+            if part_path:
+                Path(part_path).unlink(missing_ok=True)
+
 # ============================================================================
 # ENHANCED CONTACT EXTRACTOR
 # ============================================================================
 
+# Asset file extensions that show up in scraped pseudo-emails like "logo@2x.png"
+ASSET_EXTENSION_RE = re.compile('|'.join(map(re.escape, ['.png', '.jpg', '.jpeg', '.gif', '.webp', '.css', '.js'])), re.I)
+VALID_EMAIL_RE = re.compile(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
+
 class EnhancedContactExtractor:
     """Enhanced contact information extraction with Google Maps integration"""
     
@@ -1009,47 +1449,37 @@ class EnhancedContactExtractor:
     def setup_patterns(self):
         """Initialize enhanced extraction patterns"""
         
-        # Phone patterns by type
-        self.phone_patterns = {
-            'mobile': [
-                r'mobile[:\s]*(\+?1?[-.\s]?$$?[2-9]\d{2}$$?[-.\s]?[2-9]\d{2}[-.\s]?\d{4})',
-                r'cell[:\s]*(\+?1?[-.\s]?$$?[2-9]\d{2}$$?[-.\s]?[2-9]\d{2}[-.\s]?\d{4})',
-            ],
-            'corporate': [
-                r'corporate[:\s]*(\+?1?[-.\s]?$$?[2-9]\d{2}$$?[-.\s]?[2-9]\d{2}[-.\s]?\d{4})',
-                r'headquarters[:\s]*(\+?1?[-.\s]?$$?[2-9]\d{2}$$?[-.\s]?[2-9]\d{2}[-.\s]?\d{4})',
-                r'main[:\s]*(\+?1?[-.\s]?$$?[2-9]\d{2}$$?[-.\s]?[2-9]\d{2}[-.\s]?\d{4})',
-            ],
-            'support': [
-                r'support[:\s]*(\+?1?[-.\s]?$$?[2-9]\d{2}$$?[-.\s]?[2-9]\d{2}[-.\s]?\d{4})',
-                r'customer\s*service[:\s]*(\+?1?[-.\s]?$$?[2-9]\d{2}$$?[-.\s]?[2-9]\d{2}[-.\s]?\d{4})',
-                r'help[:\s]*(\+?1?[-.\s]?$$?[2-9]\d{2}$$?[-.\s]?[2-9]\d{2}[-.\s]?\d{4})',
-            ],
-            'general': [
-                r'\b(\+?1?[-.\s]?$$?[2-9]\d{2}$$?[-.\s]?[2-9]\d{2}[-.\s]?\d{4})\b',
-            ]
+        # Phone labels (lowercased, whitespace removed) and the phone type each one marks
+        self.phone_label_types = {
+            'mobile': 'mobile', 'cell': 'mobile',
+            'corporate': 'corporate', 'headquarters': 'corporate', 'main': 'corporate',
+            'support': 'support', 'customerservice': 'support', 'help': 'support',
         }
         
-        # Email pattern
-        self.email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,7}\b'
+        # One pass finds every phone number along with the label directly before it.
+        # Labels are whole words, and the number may not be cut out of a longer
+        # digit run (order or tracking numbers); (?<!\w) acts as \b but still
+        # lets a number open with '(' or '+'.
+        self.phone_re = re.compile(
+            r'(?:\b(?P<label>mobile|cell|corporate|headquarters|main|support|customer\s*service|help)\b[:\s]*)?'
+            r'(?<!\w)(?P<number>\+?1?[-.\s]?\(?[2-9]\d{2}\)?[-.\s]?[2-9]\d{2}[-.\s]?\d{4})\b',
+            re.IGNORECASE
+        )
+        self.non_digit_re = re.compile(r'[^\d]')
+        
+        # Email patterns
+        self.email_re = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,7}\b', re.IGNORECASE)
+        self.mailto_re = re.compile(r'^mailto:', re.I)
         
         # Address patterns
         self.address_patterns = [
-            r'\b(\d{1,5}\s[\w\s]{3,30},\s*[\w\s]{3,20},\s*[A-Z]{2}\s*\d{5}(?:-\d{4})?)\b',
-            r'\b(\d{1,5}\s[\w\s]{3,30},?\s*[\w\s]{3,20},?\s*[A-Za-z]{2,15}\s*\d{5,10})\b'
+            re.compile(r'\b(\d{1,5}\s[\w\s]{3,30},\s*[\w\s]{3,20},\s*[A-Z]{2}\s*\d{5}(?:-\d{4})?)\b'),
+            re.compile(r'\b(\d{1,5}\s[\w\s]{3,30},?\s*[\w\s]{3,20},?\s*[A-Za-z]{2,15}\s*\d{5,10})\b')
         ]
+        self.city_state_re = re.compile(r'([^,]+),\s*([A-Z]{2})\s*\d{5}')
         
         # Social media platforms
-        self.social_platforms = {
-            'facebook.com': 'facebook',
-            'instagram.com': 'instagram',
-            'tiktok.com': 'tiktok',
-            'linkedin.com': 'linkedin',
-            'twitter.com': 'twitter',
-            'x.com': 'twitter',
-            'pinterest.com': 'pinterest',
-            'youtube.com': 'youtube'
-        }
+        self.social_platforms = SOCIAL_PLATFORMS
     
     def extract_contact_info(self, pages_data: List[PageMetadata], sitemap: SiteMap) -> ContactInfo:
         """Extract comprehensive contact information with Google Maps integration"""
@@ -1057,24 +1487,24 @@ class EnhancedContactExtractor:
         
         contact_info = ContactInfo()
         
-        # Combine all text content
-        all_text = " ".join([page.text_content or "" for page in pages_data])
-        all_html = " ".join([page.html or "" for page in pages_data])
-        
         # Extract brand name
         contact_info.brand_name = self._extract_brand_name(pages_data)
         
+        # Scan every page's text for phones, emails and addresses
+        page_scans = self._scan_pages(pages_data)
+        
         # Extract phone numbers by type
-        contact_info.mobile_phone = self._extract_phone_by_type(all_text, 'mobile')
-        contact_info.corporate_phone = self._extract_phone_by_type(all_text, 'corporate')
-        contact_info.support_phone = self._extract_phone_by_type(all_text, 'support')
-        contact_info.company_phone = self._extract_phone_by_type(all_text, 'general')
+        phones = self._extract_phones_by_type(page_scans)
+        contact_info.mobile_phone = phones['mobile']
+        contact_info.corporate_phone = phones['corporate']
+        contact_info.support_phone = phones['support']
+        contact_info.company_phone = phones['general']
         
         # Extract email
-        contact_info.email = self._extract_email(all_text, pages_data)
+        contact_info.email = self._extract_email(pages_data, page_scans)
         
         # Extract address
-        address = self._extract_address(all_text)
+        address = self._extract_address(page_scans)
         contact_info.address = address
         if address:
             city, state = self._parse_city_state(address)
@@ -1090,7 +1520,7 @@ class EnhancedContactExtractor:
             contact_info.google_maps_integration = "Not Found"
         
         # Extract social media
-        contact_info.social_media = self._extract_social_media(pages_data)
+        contact_info.social_media = self._extract_social_media(sitemap)
         
         logger.info("Enhanced contact information extraction completed")
         return contact_info
@@ -1116,28 +1546,57 @@ class EnhancedContactExtractor:
         
         return None
     
-    def _extract_phone_by_type(self, text: str, phone_type: str) -> Optional[str]:
-        """Extract specific type of phone number"""
-        if phone_type not in self.phone_patterns:
-            return None
+    def _scan_pages(self, pages_data: List[PageMetadata]) -> List[Tuple[Dict[str, Set[str]], Optional[str], List[Optional[str]]]]:
+        """
+        Scan each page's text in-process. A few milliseconds of regex per page
+        costs less than starting worker processes and pickling every page's
+        text to them, and forking while IO threads run can deadlock.
+        """
+        return [self._scan_page_text(page.text_content or "") for page in pages_data]
+    
+    def _scan_page_text(self, text: str) -> Tuple[Dict[str, Set[str]], Optional[str], List[Optional[str]]]:
+        """Find phones by type, the first valid email and each address pattern's first match in one page"""
+        phones = {phone_type: set() for phone_type in ('mobile', 'corporate', 'support', 'general')}
+        for match in self.phone_re.finditer(text):
+            # Clean and validate phone, dropping the +1 country code the pattern allows
+            clean_phone = self.non_digit_re.sub('', match.group('number'))
+            if len(clean_phone) == 11 and clean_phone[0] == '1':
+                clean_phone = clean_phone[1:]
+            if len(clean_phone) == 10 and self._is_valid_phone(clean_phone):
+                formatted = f"({clean_phone[:3]}) {clean_phone[3:6]}-{clean_phone[6:]}"
+                phones['general'].add(formatted)
+                
+                label = match.group('label')
+                if label:
+                    phones[self.phone_label_types[''.join(label.lower().split())]].add(formatted)
+        
+        # finditer stops at the first accepted match instead of collecting them all
+        email = next((
+            match.group() for match in self.email_re.finditer(text) if self._is_valid_email(match.group())
+        ), None)
+        
+        addresses = [
+            next((match.group(1).strip() for match in pattern.finditer(text) if len(match.group(1).split(',')) >= 2), None)
+            for pattern in self.address_patterns
+        ]
         
-        found_phones = set()
-        for pattern in self.phone_patterns[phone_type]:
-            try:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    # Clean and validate phone
-                    clean_phone = re.sub(r'[^\d]', '', match)
-                    if len(clean_phone) == 10 and self._is_valid_phone(clean_phone):
-                        formatted = f"({clean_phone[:3]}) {clean_phone[3:6]}-{clean_phone[6:]}"
-                        found_phones.add(formatted)
-            except re.error as e:
-                logger.warning(f"Regex error in phone pattern: {e}")
-                continue
+        return phones, email, addresses
+    
+    def _extract_phones_by_type(self, page_scans: List[Tuple]) -> Dict[str, Optional[str]]:
+        """Merge per-page phone numbers grouped by type"""
+        found_phones = {phone_type: set() for phone_type in ('mobile', 'corporate', 'support', 'general')}
+        for phones, _, _ in page_scans:
+            for phone_type, numbers in phones.items():
+                found_phones[phone_type].update(numbers)
         
-        return ', '.join(sorted(found_phones)[:3]) if found_phones else None
+        return {
+            phone_type: ', '.join(sorted(phones)[:3]) if phones else None
+            for phone_type, phones in found_phones.items()
+        }
     
-    def _is_valid_phone(self, phone: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _is_valid_phone(phone: str) -> bool:
         """Validate US phone number"""
         if len(phone) != 10:
             return False
@@ -1150,87 +1609,113 @@ class EnhancedContactExtractor:
                 area_code != '911' and 
                 exchange != '911')
     
-    def _extract_email(self, text: str, pages_data: List[PageMetadata]) -> Optional[str]:
+    def _extract_email(self, pages_data: List[PageMetadata], page_scans: List[Tuple]) -> Optional[str]:
         """Extract and validate email addresses"""
         # Try mailto links first
         for page in pages_data:
             if page.html:
-                soup = BeautifulSoup(page.html, 'html.parser')
-                mailto_links = soup.find_all('a', href=re.compile(r'^mailto:', re.I))
+                soup = get_page_soup(page)
+                mailto_links = soup.find_all('a', href=self.mailto_re)
                 if mailto_links:
                     email = mailto_links[0]['href'].replace('mailto:', '').split('?')[0]
                     if self._is_valid_email(email):
                         return email
         
-        # Extract from text
-        try:
-            emails = set(re.findall(self.email_pattern, text, re.IGNORECASE))
-            valid_emails = [email for email in emails if self._is_valid_email(email)]
-            return valid_emails[0] if valid_emails else None
-        except re.error as e:
-            logger.warning(f"Regex error in email pattern: {e}")
-            return None
+        # Fall back to the first valid email found in page text
+        return next((email for _, email, _ in page_scans if email), None)
     
-    def _is_valid_email(self, email: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _is_valid_email(email: str) -> bool:
         """Validate email format and filter false positives"""
         if not email or len(email) > 254:
             return False
         
         # Check for asset files
-        asset_extensions = ['.png', '.jpg', '.jpeg', '.gif', '.webp', '.css', '.js']
-        if any(ext in email.lower() for ext in asset_extensions):
+        if ASSET_EXTENSION_RE.search(email):
             return False
         
         # Validate format
-        pattern = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
-        return bool(re.match(pattern, email))
-    
-    def _extract_address(self, text: str) -> Optional[str]:
-        """Extract physical address"""
-        for pattern in self.address_patterns:
-            try:
-                matches = re.findall(pattern, text)
-                if matches:
-                    for match in matches:
-                        if len(match.split(',')) >= 2:
-                            return match.strip()
-            except re.error as e:
-                logger.warning(f"Regex error in address pattern: {e}")
-                continue
+        return bool(VALID_EMAIL_RE.match(email))
+    
+    def _extract_address(self, page_scans: List[Tuple]) -> Optional[str]:
+        """Extract physical address, preferring earlier patterns over earlier pages"""
+        for index in range(len(self.address_patterns)):
+            for _, _, addresses in page_scans:
+                if addresses[index]:
+                    return addresses[index]
         return None
     
     def _parse_city_state(self, address: str) -> Tuple[str, str]:
         """Parse city and state from address"""
-        pattern = r'([^,]+),\s*([A-Z]{2})\s*\d{5}'
-        match = re.search(pattern, address)
+        match = self.city_state_re.search(address)
         if match:
             return match.group(1).strip(), match.group(2).strip()
         return "", ""
     
-    def _extract_social_media(self, pages_data: List[PageMetadata]) -> Dict[str, Optional[str]]:
-        """Extract social media links"""
+    def _extract_social_media(self, sitemap: SiteMap) -> Dict[str, Optional[str]]:
+        """Extract social media links collected per platform during link discovery"""
         social_media = {platform: None for platform in self.social_platforms.values()}
-        
-        for page in pages_data:
-            if page.html:
-                soup = BeautifulSoup(page.html, 'html.parser')
-                
-                for a in soup.find_all('a', href=True):
-                    href = a['href'].lower()
-                    for domain, platform in self.social_platforms.items():
-                        if domain in href and not social_media[platform]:
-                            clean_url = a['href'].split('?')[0].rstrip('/')
-                            social_media[platform] = clean_url
-        
+        social_media.update(sitemap.social_links_by_platform)
         return social_media
 
 # ============================================================================
 # ENHANCED BUSINESS INTELLIGENCE EXTRACTOR
 # ============================================================================
 
+class KeywordGroups:
+    """
+    Keyword lists per group, scored by how many distinct keywords a site uses.
+    Keywords live in one flat tuple with a parallel array of group ids and
+    match as substrings of the lowercased text ('tech' counts in "technology").
+    """
+    
+    def __init__(self, keyword_groups: Dict[str, List[str]]):
+        self.names = list(keyword_groups)
+        self.keywords = tuple(keyword for keywords in keyword_groups.values() for keyword in keywords)
+        self.group_ids = np.array(
+            [group_id for group_id, keywords in enumerate(keyword_groups.values()) for _ in keywords], dtype=np.int8
+        )
+    
+    def best(self, ctx: ExtractionContext) -> Optional[str]:
+        """Group with the most keywords found in the site's pages (first wins ties), or None"""
+        # Keywords already found are not searched for again on later pages
+        present = set()
+        remaining = set(self.keywords)
+        for text in ctx.texts_lower:
+            found = {keyword for keyword in remaining if keyword in text}
+            present |= found
+            remaining -= found
+            if not remaining:
+                break
+        
+        found_mask = np.fromiter((keyword in present for keyword in self.keywords), dtype=bool, count=len(self.keywords))
+        scores = np.bincount(self.group_ids[found_mask], minlength=len(self.names))
+        best_id = int(scores.argmax())
+        return self.names[best_id] if scores[best_id] > 0 else None
+
+# Site-wide word totals above each threshold earn the matching content-richness points
+CONTENT_WORD_THRESHOLDS = np.array([1000, 5000, 10000])
+CONTENT_WORD_POINTS = np.array([0, 15, 20, 25])
+
+def content_richness_points(total_words: np.ndarray) -> np.ndarray:
+    """Content-richness points for one or many sites' total word counts"""
+    return CONTENT_WORD_POINTS[np.searchsorted(CONTENT_WORD_THRESHOLDS, total_words, side='left')]
+
+# Firmographic completeness points, one column per signal: brand, industry,
+# founded year, address, email, company phone, social media, employees, revenue
+FIRMOGRAPHIC_WEIGHTS = np.array([10, 10, 10, 10, 10, 10, 10, 15, 15])
+
+def firmographic_scores(signals: np.ndarray) -> np.ndarray:
+    """Firmographic scores (0-100) for a (sites x 9) boolean signal matrix, or one row of it"""
+    return np.minimum(100, signals.astype(np.int64) @ FIRMOGRAPHIC_WEIGHTS)
+
 class EnhancedBusinessIntelligenceExtractor:
     """Enhanced business metrics and intelligence extraction"""
     
+    # Text-derived metrics by ExtractionContext.content_key, shared process-wide
+    text_results = BoundedCache(config.RESULT_CACHE_SIZE)
+    
     def __init__(self):
         self.setup_patterns()
         self.setup_classifications()
@@ -1240,7 +1725,7 @@ class EnhancedBusinessIntelligenceExtractor:
         
         # Employee patterns
         self.employee_patterns = [
-            r'(\d+)[-\s]*(\d+)?\s*employees?',
+            r'(?P<low>\d+)[-\s]*(?P<high>\d+)?\s*employees?',
             r'team\s*of\s*(\d+)',
             r'(\d+)\s*people',
             r'staff\s*of\s*(\d+)',
@@ -1261,6 +1746,12 @@ class EnhancedBusinessIntelligenceExtractor:
             r'since\s*(\d{4})',
             r'started\s*(?:in\s*)?(\d{4})'
         ]
+        
+        # One alternation per field, so each page is scanned once and the earliest mention wins
+        self.employee_re, self.revenue_re, self.founded_re = (
+            re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+            for patterns in (self.employee_patterns, self.revenue_patterns, self.founded_patterns)
+        )
     
     def setup_classifications(self):
         """Setup industry and budget classifications"""
@@ -1306,27 +1797,45 @@ class EnhancedBusinessIntelligenceExtractor:
                 'small business', 'individual', 'personal', 'lite'
             ]
         }
+        
+        self.industry_matcher = KeywordGroups(self.industry_keywords)
+        self.budget_matcher = KeywordGroups(self.budget_indicators)
     
-    def extract_business_metrics(self, pages_data: List[PageMetadata], contact_info: ContactInfo, sitemap: SiteMap) -> BusinessMetrics:
+    def extract_business_metrics(self, pages_data: List[PageMetadata], contact_info: ContactInfo, sitemap: SiteMap,
+                                 ctx: Optional[ExtractionContext] = None) -> BusinessMetrics:
         """Extract comprehensive business metrics with enhanced analysis"""
         logger.info("Extracting enhanced business metrics")
         
         metrics = BusinessMetrics()
         
-        # Combine all text
-        all_text = " ".join([page.text_content or "" for page in pages_data])
-        
-        # Extract industry
-        metrics.industry = self._classify_industry(all_text)
+        # Per-page site text, prepared once by the caller
+        ctx = ctx or ExtractionContext.from_pages(pages_data)
         
-        # Extract employee count
-        metrics.employees = self._extract_employees(all_text)
-        
-        # Extract revenue
-        metrics.annual_revenue = self._extract_revenue(all_text)
-        
-        # Extract founded year
-        metrics.founded_year = self._extract_founded_year(all_text)
+        # Fields derived only from page text are reused when the site's text is unchanged
+        text_fields = self.text_results.get(ctx.content_key)
+        if text_fields is None:
+            # Extract industry
+            metrics.industry = self._classify_industry(ctx)
+            
+            # Extract employee count
+            metrics.employees = self._extract_employees(ctx.texts)
+            
+            # Extract revenue
+            metrics.annual_revenue = self._extract_revenue(ctx.texts)
+            
+            # Extract founded year
+            metrics.founded_year = self._extract_founded_year(ctx.texts)
+            
+            # Classify budget segment
+            metrics.segmentation = self._classify_budget_segment(ctx, metrics)
+            
+            self.text_results.put(ctx.content_key, (
+                metrics.industry, metrics.employees, metrics.annual_revenue,
+                metrics.founded_year, metrics.segmentation
+            ))
+        else:
+            (metrics.industry, metrics.employees, metrics.annual_revenue,
+             metrics.founded_year, metrics.segmentation) = text_fields
         
         # Enhanced metrics from sitemap
         metrics.website_structure_complexity = sitemap.website_structure_complexity
@@ -1335,77 +1844,47 @@ class EnhancedBusinessIntelligenceExtractor:
         
         # Calculate scores
         metrics.firmographic_score = self._calculate_firmographic_score(metrics, contact_info)
-        metrics.engagement_score = self._calculate_engagement_score(pages_data, contact_info, sitemap)
-        
-        # Classify budget segment
-        metrics.segmentation = self._classify_budget_segment(all_text, metrics)
+        metrics.engagement_score = self._calculate_engagement_score(pages_data, contact_info, sitemap, ctx)
         
         logger.info("Enhanced business metrics extraction completed")
         return metrics
     
-    def _classify_industry(self, text: str) -> str:
-        """Classify industry based on content"""
-        text_lower = text.lower()
-        
-        industry_scores = {}
-        for industry, keywords in self.industry_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
-            if score > 0:
-                industry_scores[industry] = score
-        
-        return max(industry_scores, key=industry_scores.get) if industry_scores else "Unknown"
+    def _classify_industry(self, ctx: ExtractionContext) -> str:
+        """Classify industry based on site content"""
+        return self.industry_matcher.best(ctx) or "Unknown"
     
-    def _extract_employees(self, text: str) -> Optional[str]:
+    def _extract_employees(self, texts: List[str]) -> Optional[str]:
         """Extract employee count"""
-        for pattern in self.employee_patterns:
-            try:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                if matches:
-                    match = matches[0]
-                    if isinstance(match, tuple):
-                        if match[1]:
-                            return f"{match[0]}-{match[1]}"
-                        else:
-                            return match[0]
-                    else:
-                        return match
-            except re.error as e:
-                logger.warning(f"Regex error in employee pattern: {e}")
-                continue
-        return None
+        match = first_match(self.employee_re, texts)
+        if not match:
+            return None
+        if match.group('low'):
+            if match.group('high'):
+                return f"{match.group('low')}-{match.group('high')}"
+            return match.group('low')
+        return next(group for group in match.groups() if group)
     
-    def _extract_revenue(self, text: str) -> Optional[str]:
+    def _extract_revenue(self, texts: List[str]) -> Optional[str]:
         """Extract annual revenue"""
-        for pattern in self.revenue_patterns:
-            try:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                if matches:
-                    revenue = matches[0]
-                    if isinstance(revenue, tuple):
-                        revenue = revenue[0]
-                    return f"${revenue}"
-            except re.error as e:
-                logger.warning(f"Regex error in revenue pattern: {e}")
-                continue
+        match = first_match(self.revenue_re, texts)
+        if match:
+            return f"${next(group for group in match.groups() if group)}"
         return None
     
-    def _extract_founded_year(self, text: str) -> Optional[str]:
-        """Extract founded year"""
-        for pattern in self.founded_patterns:
-            try:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                if matches:
-                    year = matches[0]
-                    if 1800 <= int(year) <= datetime.now().year:
-                        return year
-            except (re.error, ValueError) as e:
-                logger.warning(f"Error in founded year pattern: {e}")
-                continue
+    def _extract_founded_year(self, texts: List[str]) -> Optional[str]:
+        """Extract the first plausible founded year mentioned, in page order"""
+        current_year = datetime.now().year  # Read the clock once, not per candidate
+        for text in texts:
+            for match in self.founded_re.finditer(text):
+                # Each alternative of the union pattern captures exactly one group: the year
+                year = match.group(match.lastindex)
+                if 1800 <= int(year) <= current_year:
+                    return year
         return None
     
     def _assess_digital_presence(self, sitemap: SiteMap, contact_info: ContactInfo) -> str:
         """Assess digital presence strength"""
-        social_count = sum(1 for url in contact_info.social_media.values() if url)
+        social_count = contact_info.active_social_count
         
         if social_count >= 5:
             return "Strong"
@@ -1442,51 +1921,32 @@ class EnhancedBusinessIntelligenceExtractor:
     
     def _calculate_firmographic_score(self, metrics: BusinessMetrics, contact_info: ContactInfo) -> int:
         """Calculate firmographic completeness score (0-100)"""
-        score = 0
-        
-        # Basic info (40 points)
-        if contact_info.brand_name:
-            score += 10
-        if metrics.industry != 'Unknown':
-            score += 10
-        if metrics.founded_year:
-            score += 10
-        if contact_info.address:
-            score += 10
-        
-        # Contact info (30 points)
-        if contact_info.email:
-            score += 10
-        if contact_info.company_phone:
-            score += 10
-        if contact_info.social_media and any(contact_info.social_media.values()):
-            score += 10
-        
-        # Business metrics (30 points)
-        if metrics.employees:
-            score += 15
-        if metrics.annual_revenue:
-            score += 15
-        
-        return min(100, score)
+        signals = np.array([
+            # Basic info (40 points)
+            bool(contact_info.brand_name),
+            metrics.industry != 'Unknown',
+            bool(metrics.founded_year),
+            bool(contact_info.address),
+            # Contact info (30 points)
+            bool(contact_info.email),
+            bool(contact_info.company_phone),
+            contact_info.active_social_count > 0,
+            # Business metrics (30 points)
+            bool(metrics.employees),
+            bool(metrics.annual_revenue),
+        ])
+        return int(firmographic_scores(signals))
     
-    def _calculate_engagement_score(self, pages_data: List[PageMetadata], contact_info: ContactInfo, sitemap: SiteMap) -> int:
+    def _calculate_engagement_score(self, pages_data: List[PageMetadata], contact_info: ContactInfo, sitemap: SiteMap,
+                                    ctx: ExtractionContext) -> int:
         """Calculate digital engagement score (0-100) with enhanced metrics"""
         score = 0
         
         # Social media presence (30 points)
-        if contact_info.social_media:
-            active_platforms = sum(1 for url in contact_info.social_media.values() if url)
-            score += min(30, active_platforms * 5)
+        score += min(30, contact_info.active_social_count * 5)
         
         # Content richness (25 points)
-        total_words = sum(page.word_count for page in pages_data)
-        if total_words > 10000:
-            score += 25
-        elif total_words > 5000:
-            score += 20
-        elif total_words > 1000:
-            score += 15
+        score += int(content_richness_points(ctx.word_counts.sum()))
         
         # Site structure complexity (25 points)
         if sitemap.total_pages > 20:
@@ -1506,19 +1966,12 @@ class EnhancedBusinessIntelligenceExtractor:
         
         return min(100, score)
     
-    def _classify_budget_segment(self, text: str, metrics: BusinessMetrics) -> str:
-        """Classify budget segment"""
-        text_lower = text.lower()
-        
-        # Score each segment
-        segment_scores = {}
-        for segment, keywords in self.budget_indicators.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
-            if score > 0:
-                segment_scores[segment] = score
-        
-        if segment_scores:
-            return max(segment_scores, key=segment_scores.get)
+    def _classify_budget_segment(self, ctx: ExtractionContext, metrics: BusinessMetrics) -> str:
+        """Classify budget segment from site content"""
+        # Highest-scoring segment
+        segment = self.budget_matcher.best(ctx)
+        if segment:
+            return segment
         
         # Fallback based on employee count
         if metrics.employees:
@@ -1542,19 +1995,29 @@ class EnhancedBusinessIntelligenceExtractor:
 class EnhancedMarketingIntelligenceExtractor:
     """Enhanced marketing and advertising intelligence extraction"""
     
-    def extract_marketing_intelligence(self, pages_data: List[PageMetadata], contact_info: ContactInfo, sitemap: SiteMap) -> MarketingIntelligence:
+    def __init__(self):
+        self.instagram_handle_re = re.compile(r'instagram\.com/([^/?]+)')
+        # Video/iframe embeds from any of the platforms, or anchors to a video page
+        self.video_link_re = re.compile(
+            r'<(?:video|iframe)\b[^>]*?\s(?:data-)?src\s*=\s*["\']([^"\']*(?:youtube|vimeo|tiktok|instagram)[^"\']*)["\']'
+            r'|<a\b[^>]*?\shref\s*=\s*["\']([^"\']*(?:youtube\.com/watch|vimeo\.com/|tiktok\.com/)[^"\']*)["\']',
+            re.IGNORECASE
+        )
+    
+    def extract_marketing_intelligence(self, pages_data: List[PageMetadata], contact_info: ContactInfo, sitemap: SiteMap,
+                                       ctx: Optional[ExtractionContext] = None) -> MarketingIntelligence:
         """Extract comprehensive marketing intelligence with enhanced analysis"""
         logger.info("Extracting enhanced marketing intelligence")
         
         intel = MarketingIntelligence()
         
-        # Combine all text
-        all_text = " ".join([page.text_content or "" for page in pages_data])
+        # Per-page site text, prepared once by the caller
+        ctx = ctx or ExtractionContext.from_pages(pages_data)
         
         # Extract Instagram handle
         instagram_url = contact_info.social_media.get('instagram', '')
         if instagram_url:
-            match = re.search(r'instagram\.com/([^/?]+)', instagram_url)
+            match = self.instagram_handle_re.search(instagram_url)
             if match:
                 intel.instagram_handle = f"@{match.group(1)}"
         
@@ -1563,7 +2026,7 @@ class EnhancedMarketingIntelligenceExtractor:
             'influencer', 'creator', 'collaboration', 'partnership',
             'sponsored', 'brand ambassador', 'ugc', 'user generated'
         ]
-        intel.worked_with_creators = any(keyword in all_text.lower() for keyword in creator_keywords)
+        intel.worked_with_creators = ctx.contains_any(creator_keywords)
         
         # Extract video links
         intel.integrated_video_links = self._extract_video_links(pages_data)
@@ -1582,27 +2045,26 @@ class EnhancedMarketingIntelligenceExtractor:
     
     def _extract_video_links(self, pages_data: List[PageMetadata]) -> List[str]:
         """Extract integrated video links with enhanced detection"""
+        # Pages in order, stopping once ten links are collected
         video_links = []
-        
         for page in pages_data:
-            if page.html:
-                soup = BeautifulSoup(page.html, 'html.parser')
-                
-                # Find video elements and embeds
-                videos = soup.find_all(['video', 'iframe'])
-                for video in videos:
-                    src = video.get('src') or video.get('data-src')
-                    if src and any(platform in src for platform in ['youtube', 'vimeo', 'tiktok', 'instagram']):
-                        video_links.append(src)
-                
-                # Look for video links in anchor tags
-                for a in soup.find_all('a', href=True):
-                    href = a['href']
-                    if any(platform in href for platform in ['youtube.com/watch', 'vimeo.com/', 'tiktok.com/']):
-                        video_links.append(href)
+            if not page.html:
+                continue
+            video_links.extend(self._extract_videos_from_page(page.html))
+            if len(video_links) >= 10:
+                break
         
         return video_links[:10]  # Limit to 10 videos
     
+    def _extract_videos_from_page(self, html: str) -> List[str]:
+        """Video elements, embeds and video links from one page, in one scan of the raw HTML"""
+        video_links = []
+        for match in self.video_link_re.finditer(html):
+            video_links.append(unescape(match.group(1) or match.group(2)))
+            if len(video_links) >= 10:
+                break
+        return video_links
+    
     def _calculate_enhanced_ig_score(self, intel: MarketingIntelligence, contact_info: ContactInfo, sitemap: SiteMap) -> int:
         """Calculate enhanced Instagram engagement score"""
         score = 0
@@ -1617,8 +2079,7 @@ class EnhancedMarketingIntelligenceExtractor:
             score += min(20, len(intel.integrated_video_links) * 2)
         
         # Social media presence bonus
-        active_platforms = sum(1 for url in contact_info.social_media.values() if url)
-        score += min(20, active_platforms * 3)
+        score += min(20, contact_info.active_social_count * 3)
         
         # Website complexity bonus
         if sitemap.website_structure_complexity in ['Complex', 'Moderate']:
@@ -1648,6 +2109,9 @@ class EnhancedMarketingIntelligenceExtractor:
 class EnhancedWebsiteFeaturesDetector:
     """Enhanced website features and capabilities detection"""
     
+    # Text-based feature flags by ExtractionContext.content_key, shared process-wide
+    text_results = BoundedCache(config.RESULT_CACHE_SIZE)
+    
     def __init__(self):
         self.feature_keywords = {
             'd2c_presence': ['d2c', 'direct to consumer', 'shop', 'buy now', 'cart', 'checkout'],
@@ -1660,29 +2124,43 @@ class EnhancedWebsiteFeaturesDetector:
             'contact_forms': ['contact form', 'get in touch', 'send message', 'form'],
             'newsletter_signup': ['newsletter', 'subscribe', 'email updates', 'mailing list']
         }
+        
+        # Only keyword groups naming a real WebsiteFeatures field are checked
+        feature_names = {f.name for f in fields(WebsiteFeatures)}
+        self.valid_features = tuple(
+            (feature, tuple(keywords)) for feature, keywords in self.feature_keywords.items()
+            if feature in feature_names
+        )
+        
+        # Markup that marks a page as carrying video, matched in lowercased HTML
+        self.video_markers = ('<video', 'youtube.com/embed', 'vimeo.com', 'video-js', 'tiktok.com')
     
-    def detect_features(self, pages_data: List[PageMetadata], sitemap: SiteMap) -> WebsiteFeatures:
+    def detect_features(self, pages_data: List[PageMetadata], sitemap: SiteMap,
+                        ctx: Optional[ExtractionContext] = None) -> WebsiteFeatures:
         """Detect enhanced website features with comprehensive analysis"""
         logger.info("Detecting enhanced website features")
         
         features = WebsiteFeatures()
         
-        # Combine all text and HTML
-        all_text = " ".join([page.text_content or "" for page in pages_data]).lower()
-        all_html = " ".join([page.html or "" for page in pages_data]).lower()
+        # Per-page site text, prepared once by the caller
+        ctx = ctx or ExtractionContext.from_pages(pages_data)
         
-        # Check text-based features
-        for feature, keywords in self.feature_keywords.items():
-            if hasattr(features, feature):
-                setattr(features, feature, any(kw in all_text for kw in keywords))
+        # Check text-based features, reusing the flags when the site's text is unchanged
+        text_flags = self.text_results.get(ctx.content_key)
+        if text_flags is None:
+            text_flags = tuple((feature, ctx.contains_any(keywords)) for feature, keywords in self.valid_features)
+            self.text_results.put(ctx.content_key, text_flags)
+        for feature, present in text_flags:
+            setattr(features, feature, present)
         
         # Enhanced social media presence detection
         features.social_media_presence = len(sitemap.social_links) > 0
         
-        # Special checks
-        features.video_presence = any(tag in all_html for tag in [
-            '<video', 'youtube.com/embed', 'vimeo.com', 'video-js', 'tiktok.com'
-        ])
+        # Special checks, one page at a time so a hit stops the scan early
+        features.video_presence = any(
+            any(marker in html_lower for marker in self.video_markers)
+            for html_lower in (page.html.lower() for page in pages_data if page.html)
+        )
         
         # Technical features
         if pages_data:
@@ -1697,15 +2175,81 @@ class EnhancedWebsiteFeaturesDetector:
 # ENHANCED METADATA EXTRACTOR
 # ============================================================================
 
+# Patterns shared by every metadata extraction call
+WHITESPACE_RUN_RE = re.compile(r'\s+')
+SENTENCE_RE = re.compile(r'[^.!?]+')
+META_DESCRIPTION_NAME_RE = re.compile(r'^description$', re.I)
+META_KEYWORDS_NAME_RE = re.compile(r'^keywords$', re.I)
+
+# Image extensions a logo URL may end with, and names of stock/placeholder images
+LOGO_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp')
+LOGO_GENERIC_RE = re.compile(r'placeholder|default|sample|test', re.I)
+
+# Navigation and footer boilerplate that disqualifies a sentence from about text
+UNWANTED_ABOUT_PHRASES = [
+    'home', 'contact us', 'privacy policy', 'terms of service',
+    'copyright', '©', 'all rights reserved', 'follow us',
+    'subscribe', 'newsletter', 'social media'
+]
+
+# Page chrome left out of about-page text
+ABOUT_EXCLUDED_TAGS = ['nav', 'footer', 'header', 'aside', 'script', 'style']
+
+# About text is cut to this many characters
+ABOUT_TEXT_LIMIT = 2000
+
+def strings_outside(element: Tag, excluded_tags: List[str]) -> Iterator[str]:
+    """
+    Lazily yield the same strings as element.stripped_strings once excluded_tags
+    are decomposed, but without modifying the (shared, cached) tree. Only
+    excluded tags inside element count; the walk never looks above it, and an
+    excluded subtree is skipped whole rather than checked string by string.
+    """
+    stack = [iter(element.children)]
+    while stack:
+        for child in stack[-1]:
+            if isinstance(child, Tag):
+                if child.name not in excluded_tags:
+                    stack.append(iter(child.children))
+                    break
+            elif type(child) in (NavigableString, CData):
+                stripped = child.strip()
+                if stripped:
+                    yield stripped
+        else:
+            stack.pop()
+
+def longer_than(strings: Iterator[str], length: int) -> Tuple[bool, Iterator[str]]:
+    """
+    Whether ' '.join(strings) would exceed length, reading only as many strings
+    as needed. Also returns an iterator that still yields every string.
+    """
+    head = []
+    joined_length = -1
+    for string in strings:
+        head.append(string)
+        joined_length += len(string) + 1
+        if joined_length > length:
+            return True, chain(head, strings)
+    return False, iter(head)
+
 class EnhancedMetadataExtractor:
     """Enhanced metadata extraction with comprehensive analysis"""
     
     def __init__(self):
-        self.about_keywords = [
+        self.about_keywords = frozenset([
             'about', 'about-us', 'about_us', 'aboutus', 'story', 'our-story', 
             'company', 'history', 'mission', 'vision', 'team', 'who-we-are',
             'our-company', 'background', 'overview', 'profile'
-        ]
+        ])
+        # A URL containing 'about-us' also contains 'about', so only keywords that
+        # do not contain another keyword need to be in the alternation
+        url_keywords = sorted(
+            keyword for keyword in self.about_keywords
+            if not any(other != keyword and other in keyword for other in self.about_keywords)
+        )
+        self.about_url_re = re.compile('|'.join(map(re.escape, url_keywords)), re.I)
+        self.about_content_phrases = ('about us', 'our story', 'our company', 'who we are', 'our mission')
         
         self.logo_selectors = [
             'img[class*="logo" i]',
@@ -1719,6 +2263,26 @@ class EnhancedMetadataExtractor:
             '.site-logo img',
             '[class*="brand"] img'
         ]
+        
+        # <link rel> values for the favicon, in order of preference
+        self.favicon_rels = ['icon', 'shortcut icon', 'apple-touch-icon']
+        
+        self.content_selectors = [
+            'main', 'article', '.content', '#content', '.main-content',
+            '.about-content', '.page-content', '.entry-content'
+        ]
+        
+        self.about_selectors = [
+            'section[id*="about" i]', 'div[class*="about" i]',
+            'section[class*="about" i]', 'div[id*="about" i]',
+            'section[id*="story" i]', 'div[class*="story" i]',
+            'section[id*="mission" i]', 'div[class*="mission" i]',
+            'section[id*="company" i]', 'div[class*="company" i]'
+        ]
+        
+        # Selectors are compiled once and matched against every page's tree
+        self.content_matchers = [soupsieve.compile(selector) for selector in self.content_selectors]
+        self.about_matchers = [soupsieve.compile(selector) for selector in self.about_selectors]
     
     def extract_enhanced_metadata(self, pages_data: List[PageMetadata], main_url: str, sitemap: SiteMap) -> EnhancedMetadata:
         """Extract comprehensive enhanced metadata from all pages with sitemap integration"""
@@ -1732,22 +2296,23 @@ class EnhancedMetadataExtractor:
         # Extract from main page first
         main_page = pages_data[0]
         if main_page.html:
-            soup = BeautifulSoup(main_page.html, 'html.parser')
+            soup = get_page_soup(main_page)
+            head_tags = self._collect_head_tags(soup)
             
             # Extract site title
-            metadata.site_title = self._extract_site_title(soup)
+            metadata.site_title = self._extract_site_title(head_tags.get('title'))
             
             # Extract meta description
-            metadata.meta_description = self._extract_meta_description(soup)
+            metadata.meta_description = self._extract_meta_description(head_tags.get('description'))
             
             # Extract meta keywords
-            metadata.meta_keywords = self._extract_meta_keywords(soup)
+            metadata.meta_keywords = self._extract_meta_keywords(head_tags.get('keywords'))
             
             # Extract logo URL
             metadata.logo_url = self._extract_logo_url(soup, main_url)
             
             # Extract favicon
-            metadata.favicon_url = self._extract_favicon_url(soup, main_url)
+            metadata.favicon_url = self._extract_favicon_url(head_tags, main_url)
         
         # Collect all page titles for comprehensive analysis
         metadata.all_page_titles = [page.title for page in pages_data if page.title]
@@ -1763,84 +2328,123 @@ class EnhancedMetadataExtractor:
         logger.info("Enhanced metadata extraction completed")
         return metadata
     
-    def _extract_site_title(self, soup: BeautifulSoup) -> Optional[str]:
+    def _collect_head_tags(self, soup: BeautifulSoup) -> Dict[str, Tag]:
+        """
+        First <title>, description and keywords <meta>, and favicon <link> of
+        each rel, collected in a single walk over those tags
+        """
+        head_tags = {}
+        for tag in soup.find_all(['title', 'meta', 'link']):
+            if tag.name == 'title':
+                head_tags.setdefault('title', tag)
+            elif tag.name == 'meta':
+                name = tag.get('name')
+                if name is None:
+                    continue
+                if META_DESCRIPTION_NAME_RE.search(name):
+                    head_tags.setdefault('description', tag)
+                elif META_KEYWORDS_NAME_RE.search(name):
+                    head_tags.setdefault('keywords', tag)
+            else:
+                rel = ' '.join(tag.get('rel') or [])
+                if rel in self.favicon_rels:
+                    head_tags.setdefault(rel, tag)
+        return head_tags
+    
+    def _extract_site_title(self, title_tag: Optional[Tag]) -> Optional[str]:
         """Extract site title from <title> tag"""
-        title_tag = soup.find('title')
         if title_tag and title_tag.string:
             title = title_tag.string.strip()
             # Clean up common artifacts
-            title = re.sub(r'\s+', ' ', title)
+            title = WHITESPACE_RUN_RE.sub(' ', title)
             return title[:200]  # Limit length
         return None
     
-    def _extract_meta_description(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_meta_description(self, meta_desc: Optional[Tag]) -> Optional[str]:
         """Extract meta description from <meta name="description">"""
-        meta_desc = soup.find('meta', attrs={'name': re.compile(r'^description$', re.I)})
         if meta_desc and meta_desc.get('content'):
             description = meta_desc['content'].strip()
             # Clean up the description
-            description = re.sub(r'\s+', ' ', description)
+            description = WHITESPACE_RUN_RE.sub(' ', description)
             return description[:500]  # Limit length
         return None
     
-    def _extract_meta_keywords(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_meta_keywords(self, meta_keywords: Optional[Tag]) -> Optional[str]:
         """Extract meta keywords from <meta name="keywords">"""
-        meta_keywords = soup.find('meta', attrs={'name': re.compile(r'^keywords$', re.I)})
         if meta_keywords and meta_keywords.get('content'):
             keywords = meta_keywords['content'].strip()
             # Clean up keywords
-            keywords = re.sub(r'\s+', ' ', keywords)
+            keywords = WHITESPACE_RUN_RE.sub(' ', keywords)
             return keywords[:300]  # Limit length
         return None
     
     def _extract_logo_url(self, soup: BeautifulSoup, base_url: str) -> Optional[str]:
-        """Extract company logo URL with comprehensive detection"""
-        for selector in self.logo_selectors:
-            try:
-                logo_imgs = soup.select(selector)
-                for img in logo_imgs:
-                    src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
-                    if src:
-                        # Convert relative URLs to absolute
-                        if src.startswith('//'):
-                            logo_url = 'https:' + src
-                        elif src.startswith('/'):
-                            logo_url = urljoin(base_url, src)
-                        elif src.startswith('http'):
-                            logo_url = src
-                        else:
-                            logo_url = urljoin(base_url, src)
-                        
-                        # Validate logo URL
-                        if self._is_valid_logo_url(logo_url):
-                            return logo_url
-            except Exception as e:
-                logger.debug(f"Error with logo selector {selector}: {e}")
+        """
+        Extract company logo URL with comprehensive detection. Every <img> is
+        visited once; the logo is the valid image matching the earliest entry
+        of logo_selectors, first in document order among equals.
+        """
+        best_rank, best_url = len(self.logo_selectors), None
+        for img in soup.find_all('img'):
+            rank = self._logo_selector_rank(img)
+            if rank is None or rank >= best_rank:
                 continue
+            
+            src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
+            if src:
+                # Convert relative and protocol-relative URLs to absolute
+                logo_url = urljoin(base_url, src)
+                
+                # Validate logo URL
+                if self._is_valid_logo_url(logo_url):
+                    best_rank, best_url = rank, logo_url
+                    if rank == 0:
+                        break
         
+        return best_url
+    
+    def _logo_selector_rank(self, img: Tag) -> Optional[int]:
+        """Index of the first entry of logo_selectors that matches img, or None"""
+        if 'logo' in ' '.join(img.get('class') or []).lower():
+            return 0
+        if 'logo' in (img.get('id') or '').lower():
+            return 1
+        if 'logo' in (img.get('alt') or '').lower():
+            return 2
+        
+        ancestor_classes = set()
+        ancestor_class_attrs = []
+        ancestor_ids = set()
+        in_header = False
+        for ancestor in img.parents:
+            if ancestor.parent is None:  # The BeautifulSoup document itself
+                break
+            classes = ancestor.get('class') or []
+            ancestor_classes.update(classes)
+            ancestor_class_attrs.append(' '.join(classes))
+            ancestor_ids.add(ancestor.get('id'))
+            in_header = in_header or ancestor.name == 'header'
+        
+        if 'logo' in ancestor_classes:
+            return 3
+        if 'logo' in ancestor_ids:
+            return 4
+        if in_header and img.parent.find(True, recursive=False) is img:  # header img:first-child
+            return 5
+        for rank, class_name in ((6, 'navbar-brand'), (7, 'header-logo'), (8, 'site-logo')):
+            if class_name in ancestor_classes:
+                return rank
+        if any('brand' in class_attr for class_attr in ancestor_class_attrs):
+            return 9
         return None
     
-    def _extract_favicon_url(self, soup: BeautifulSoup, base_url: str) -> Optional[str]:
+    def _extract_favicon_url(self, head_tags: Dict[str, Tag], base_url: str) -> Optional[str]:
         """Extract favicon URL"""
         # Look for favicon link tags
-        favicon_selectors = [
-            'link[rel="icon"]',
-            'link[rel="shortcut icon"]',
-            'link[rel="apple-touch-icon"]'
-        ]
-        
-        for selector in favicon_selectors:
-            favicon = soup.select_one(selector)
+        for rel in self.favicon_rels:
+            favicon = head_tags.get(rel)
             if favicon and favicon.get('href'):
-                href = favicon['href']
-                if href.startswith('//'):
-                    return 'https:' + href
-                elif href.startswith('/'):
-                    return urljoin(base_url, href)
-                elif href.startswith('http'):
-                    return href
-                else:
-                    return urljoin(base_url, href)
+                return urljoin(base_url, favicon['href'])
         
         # Default favicon location
         return urljoin(base_url, '/favicon.ico')
@@ -1850,42 +2454,41 @@ class EnhancedMetadataExtractor:
         if not url:
             return False
         
-        # Check file extension
-        valid_extensions = ['.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp']
-        url_lower = url.lower()
-        
-        # Must have valid image extension
-        if not any(ext in url_lower for ext in valid_extensions):
+        # Must have valid image extension (ignoring any query string)
+        path = url.split('?', 1)[0].split('#', 1)[0]
+        if not path.lower().endswith(LOGO_EXTENSIONS):
             return False
         
         # Should not be too generic
-        generic_terms = ['placeholder', 'default', 'sample', 'test']
-        if any(term in url_lower for term in generic_terms):
-            return False
-        
-        return True
+        return not LOGO_GENERIC_RE.search(url)
     
     def _find_and_extract_about_content_enhanced(self, pages_data: List[PageMetadata], sitemap: SiteMap) -> Dict[str, Optional[str]]:
         """Find about page and extract comprehensive about content using sitemap"""
         about_content = {'text': None, 'url': None}
         
+        # Index pages by URL once (first page wins, as with a linear scan)
+        pages_by_url = {}
+        for page in pages_data:
+            pages_by_url.setdefault(page.url, page)
+        
         # First, look for dedicated about pages using sitemap
         about_pages = []
+        about_page_ids = set()
         for link in sitemap.internal_links:
             if link.is_about:
                 # Find corresponding page data
-                for page in pages_data:
-                    if page.url == link.url:
-                        about_pages.append(page)
-                        page.is_about_page = True
-                        break
+                page = pages_by_url.get(link.url)
+                if page is not None and id(page) not in about_page_ids:
+                    about_pages.append(page)
+                    about_page_ids.add(id(page))
+                    page.is_about_page = True
         
         # Also check pages that weren't caught by sitemap
         for page in pages_data:
-            if self._is_about_page(page.url, page.text_content or ''):
-                if page not in about_pages:
-                    about_pages.append(page)
-                    page.is_about_page = True
+            if id(page) not in about_page_ids and self._is_about_page(page.url, page.text_content or ''):
+                about_pages.append(page)
+                about_page_ids.add(id(page))
+                page.is_about_page = True
         
         # If we found dedicated about pages, extract from the most comprehensive one
         if about_pages:
@@ -1899,26 +2502,26 @@ class EnhancedMetadataExtractor:
                 about_content['url'] = best_about_page.url
                 return about_content
         
-        # If no dedicated about page, look for about sections in all pages
-        all_about_text = []
+        # If no dedicated about page, look for about sections in all pages,
+        # removing duplicates as they are found
+        unique_about_text = []
+        seen_text = set()
+        combined_length = -2
         for page in pages_data:
-            if page.html:
-                soup = BeautifulSoup(page.html, 'html.parser')
-                about_sections = self._extract_about_sections_from_soup(soup)
-                all_about_text.extend(about_sections)
-        
-        if all_about_text:
-            # Combine all about text, removing duplicates
-            unique_about_text = []
-            seen_text = set()
-            
-            for text in all_about_text:
-                # Create a hash of the text to check for duplicates
-                text_hash = hashlib.md5(text.lower().encode()).hexdigest()
-                if text_hash not in seen_text and len(text) > 50:
+            if not page.html:
+                continue
+            for text in self._extract_about_sections_from_soup(get_page_soup(page)):
+                # Case-insensitive duplicate check; the set hashes the folded text itself
+                text_key = text.casefold()
+                if text_key not in seen_text and len(text) > 50:
                     unique_about_text.append(text)
-                    seen_text.add(text_hash)
-            
+                    seen_text.add(text_key)
+                    combined_length += len(text) + 2
+            # Later pages cannot change the first 3000 characters
+            if combined_length >= 3000:
+                break
+        
+        if unique_about_text:
             # Combine the unique about text
             combined_text = '\n\n'.join(unique_about_text)
             about_content['text'] = combined_text[:3000]  # Limit to 3000 characters
@@ -1927,52 +2530,39 @@ class EnhancedMetadataExtractor:
     
     def _is_about_page(self, url: str, text_content: str) -> bool:
         """Determine if a page is an about page"""
-        url_lower = url.lower()
-        
         # Check URL for about keywords
-        url_indicators = any(keyword in url_lower for keyword in self.about_keywords)
+        if self.about_url_re.search(url):
+            return True
         
-        # Check content for about indicators
+        # Check content for about indicators; lowering once and testing each
+        # phrase with 'in' beats a case-insensitive regex over the whole text
         text_lower = text_content.lower() if text_content else ''
-        content_indicators = (
-            'about us' in text_lower or 
-            'our story' in text_lower or 
-            'our company' in text_lower or
-            'who we are' in text_lower or
-            'our mission' in text_lower
-        )
-        
-        return url_indicators or content_indicators
+        return any(phrase in text_lower for phrase in self.about_content_phrases)
     
     def _extract_about_text_from_page(self, page: PageMetadata) -> Optional[str]:
         """Extract about text from a dedicated about page"""
         if not page.html:
-            return page.text_content[:2000] if page.text_content else None
-        
-        soup = BeautifulSoup(page.html, 'html.parser')
-        
-        # Remove navigation, footer, and other non-content elements
-        for element in soup(['nav', 'footer', 'header', 'aside', 'script', 'style']):
-            element.decompose()
+            return page.text_content[:ABOUT_TEXT_LIMIT] if page.text_content else None
         
-        # Look for main content areas
-        content_selectors = [
-            'main', 'article', '.content', '#content', '.main-content',
-            '.about-content', '.page-content', '.entry-content'
-        ]
+        soup = get_page_soup(page)
         
-        for selector in content_selectors:
-            content_area = soup.select_one(selector)
+        # Look for main content areas, ignoring navigation, footer, and other
+        # non-content elements (the cached tree is shared, so nothing is removed)
+        for matcher in self.content_matchers:
+            content_area = next(
+                (el for el in matcher.select(soup) if not el.find_parent(ABOUT_EXCLUDED_TAGS)
+                 and el.name not in ABOUT_EXCLUDED_TAGS),
+                None
+            )
             if content_area:
-                text = content_area.get_text(separator=' ', strip=True)
-                if len(text) > 100:
-                    return self._clean_about_text(text)
+                is_long, strings = longer_than(strings_outside(content_area, ABOUT_EXCLUDED_TAGS), 100)
+                if is_long:
+                    return self._clean_about_strings(strings)
         
         # Fallback: get all text from body
         body = soup.find('body')
         if body:
-            text = body.get_text(separator=' ', strip=True)
-            return self._clean_about_text(text)[:2000]
+            return self._clean_about_strings(strings_outside(body, ABOUT_EXCLUDED_TAGS))[:ABOUT_TEXT_LIMIT]
         
         return None
     
@@ -1981,85 +2571,112 @@ class EnhancedMetadataExtractor:
         about_sections = []
         
         # Look for sections with about-related IDs or classes
-        about_selectors = [
-            'section[id*="about" i]', 'div[class*="about" i]',
-            'section[class*="about" i]', 'div[id*="about" i]',
-            'section[id*="story" i]', 'div[class*="story" i]',
-            'section[id*="mission" i]', 'div[class*="mission" i]',
-            'section[id*="company" i]', 'div[class*="company" i]'
-        ]
-        
-        for selector in about_selectors:
+        for matcher in self.about_matchers:
             try:
-                elements = soup.select(selector)
+                elements = matcher.select(soup)
                 for element in elements:
-                    text = element.get_text(separator=' ', strip=True)
-                    if len(text) > 100:  # Only meaningful content
-                        cleaned_text = self._clean_about_text(text)
+                    is_long, strings = longer_than(element.stripped_strings, 100)
+                    if is_long:  # Only meaningful content
+                        cleaned_text = self._clean_about_strings(strings)
                         if cleaned_text:
                             about_sections.append(cleaned_text)
             except Exception as e:
-                logger.debug(f"Error with about selector {selector}: {e}")
+                logger.debug(f"Error with about selector {matcher.pattern}: {e}")
                 continue
         
         return about_sections
     
     def _clean_about_text(self, text: str) -> str:
         """Clean and format about text"""
-        if not text:
+        if not text or not text.strip():
             return ''
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
-        
-        # Remove common navigation and footer text
-        unwanted_phrases = [
-            'home', 'contact us', 'privacy policy', 'terms of service',
-            'copyright', '©', 'all rights reserved', 'follow us',
-            'subscribe', 'newsletter', 'social media'
-        ]
-        
-        # Split into sentences and filter
-        sentences = re.split(r'[.!?]+', text)
+        return self._clean_about_strings([text.strip()])
+    
+    def _clean_about_strings(self, strings: Iterable[str]) -> str:
+        """
+        Clean and format the about text ' '.join(strings), where every string is
+        stripped and non-empty. Strings are consumed only until the cleaned text
+        passes ABOUT_TEXT_LIMIT, so long pages are never joined in full.
+        """
         filtered_sentences = []
+        cleaned_length = -2
         
-        for sentence in sentences:
+        def keep(sentence: str) -> bool:
+            """Keep a sentence unless it is short or navigation/footer text; False once over the limit"""
+            nonlocal cleaned_length
             sentence = sentence.strip()
-            if (len(sentence) > 20 and 
-                not any(phrase in sentence.lower() for phrase in unwanted_phrases)):
+            sentence_lower = sentence.lower()  # Lowered once, not per phrase
+            if len(sentence) > 20 and not any(phrase in sentence_lower for phrase in UNWANTED_ABOUT_PHRASES):
                 filtered_sentences.append(sentence)
+                cleaned_length += len(sentence) + 2
+            return cleaned_length <= ABOUT_TEXT_LIMIT
+        
+        # Split into sentences as the text arrives; the tail after the last
+        # terminator stays pending until the next string (or the end)
+        pending = ''
+        for string in strings:
+            # Remove extra whitespace
+            string = WHITESPACE_RUN_RE.sub(' ', string)
+            pending = f'{pending} {string}' if pending else string
+            
+            last_terminator = max(pending.rfind('.'), pending.rfind('!'), pending.rfind('?'))
+            if last_terminator < 0:
+                continue
+            complete, pending = pending[:last_terminator + 1], pending[last_terminator + 1:]
+            if not all(keep(match.group()) for match in SENTENCE_RE.finditer(complete)):
+                break
+        else:
+            keep(pending)
         
         cleaned_text = '. '.join(filtered_sentences)
         
         # Limit length
-        if len(cleaned_text) > 2000:
-            cleaned_text = cleaned_text[:2000] + '...'
+        if len(cleaned_text) > ABOUT_TEXT_LIMIT:
+            cleaned_text = cleaned_text[:ABOUT_TEXT_LIMIT] + '...'
         
         return cleaned_text
     
     def _compile_keywords_from_all_pages(self, pages_data: List[PageMetadata]) -> List[str]:
-        """Compile keywords from all pages"""
-        all_keywords = set()
+        """Compile the first 20 distinct keywords across all pages, in page order"""
+        all_keywords = {}  # Insertion-ordered set
         
         for page in pages_data:
-            if page.html:
-                soup = BeautifulSoup(page.html, 'html.parser')
-                
-                # Extract meta keywords
-                meta_keywords = soup.find('meta', attrs={'name': re.compile(r'^keywords$', re.I)})
-                if meta_keywords and meta_keywords.get('content'):
-                    keywords = meta_keywords['content'].split(',')
-                    for keyword in keywords:
-                        clean_keyword = keyword.strip()
-                        if clean_keyword and len(clean_keyword) > 2:
-                            all_keywords.add(clean_keyword)
+            # Extract meta keywords from the <meta> attributes recorded when the
+            # page was analyzed, so no tree has to be parsed or walked here
+            meta_keywords = next(
+                (tag for tag in page.meta_tags
+                 if tag.get('name') is not None and META_KEYWORDS_NAME_RE.search(tag['name'])),
+                None
+            )
+            if meta_keywords and meta_keywords.get('content'):
+                keywords = meta_keywords['content'].split(',')
+                for keyword in keywords:
+                    clean_keyword = keyword.strip()
+                    if clean_keyword and len(clean_keyword) > 2:
+                        all_keywords[clean_keyword] = None
+                        if len(all_keywords) == 20:  # Limit to 20 keywords
+                            return list(all_keywords)
         
-        return list(all_keywords)[:20]  # Limit to 20 keywords
+        return list(all_keywords)
 
 # ============================================================================
 # MAIN ENHANCED WEBSITE ANALYZER
 # ============================================================================
 
+# URL keywords per page type, in priority order
+PAGE_TYPE_KEYWORDS = [
+    ('about', ['about', 'story', 'company']),
+    ('contact', ['contact', 'reach', 'touch']),
+    ('product', ['product', 'service', 'solution']),
+    ('blog', ['blog', 'news', 'article']),
+    ('team', ['team', 'staff', 'people']),
+]
+PAGE_TYPE_RANK = {
+    keyword: rank for rank, (_, keywords) in enumerate(PAGE_TYPE_KEYWORDS) for keyword in keywords
+}
+# Zero-width lookahead so overlapping keywords ('newstory') are all reported
+PAGE_TYPE_RE = re.compile('(?=(' + '|'.join(map(re.escape, PAGE_TYPE_RANK)) + '))')
+
 class EnhancedCompleteWebsiteAnalyzer:
     """Enhanced complete website analysis system with comprehensive link discovery"""
     
@@ -2077,11 +2694,17 @@ class EnhancedCompleteWebsiteAnalyzer:
         """Perform comprehensive website analysis with complete link discovery"""
         logger.info(f"Starting comprehensive enhanced analysis for: {url}")
         
-        domain = urlparse(url).netloc.replace("www.", "")
+        domain = strip_www(urlparse(url).netloc)
         base_folder = Path("analyzed") / domain
         base_folder.mkdir(parents=True, exist_ok=True)
         
-        driver_manager = EnhancedWebDriverManager()
+        driver_pool = EnhancedWebDriverPool()
+        # Raw-data files are written here while extraction runs; shutdown waits for them
+        io_pool = ThreadPoolExecutor(max_workers=config.IO_WORKERS)
+        # One bounded pool for every image on the site, fed by the io_pool tasks
+        image_downloader = ImageDownloader()
+        # Parsed trees are kept for the extraction passes, at most SOUP_CACHE_SIZE at a time
+        soup_cache = PageSoupCache()
         
         try:
             # Step 1: Comprehensive link discovery
@@ -2090,7 +2713,7 @@ class EnhancedCompleteWebsiteAnalyzer:
             
             # Step 2: Analyze ALL discovered pages
             logger.info("Phase 2: Analyzing all discovered pages")
-            pages_data = self._analyze_all_discovered_pages(sitemap, driver_manager)
+            pages_data = self._analyze_all_discovered_pages(sitemap, driver_pool, soup_cache)
             
             if not pages_data:
                 logger.error(f"No data extracted for {url}")
@@ -2102,14 +2725,15 @@ class EnhancedCompleteWebsiteAnalyzer:
             
             # Step 4: Save comprehensive raw data
             logger.info("Phase 4: Saving comprehensive raw data")
-            self._save_comprehensive_raw_data(pages_data, sitemap, base_folder, domain)
+            self._save_comprehensive_raw_data(pages_data, sitemap, base_folder, domain, io_pool, image_downloader)
             
             # Step 5: Extract enhanced business intelligence
             logger.info("Phase 5: Extracting enhanced business intelligence")
             contact_info = self.contact_extractor.extract_contact_info(pages_data, sitemap)
-            business_metrics = self.business_extractor.extract_business_metrics(pages_data, contact_info, sitemap)
-            marketing_intel = self.marketing_extractor.extract_marketing_intelligence(pages_data, contact_info, sitemap)
-            website_features = self.features_detector.detect_features(pages_data, sitemap)
+            extraction_ctx = ExtractionContext.from_pages(pages_data)
+            business_metrics = self.business_extractor.extract_business_metrics(pages_data, contact_info, sitemap, extraction_ctx)
+            marketing_intel = self.marketing_extractor.extract_marketing_intelligence(pages_data, contact_info, sitemap, extraction_ctx)
+            website_features = self.features_detector.detect_features(pages_data, sitemap, extraction_ctx)
             enhanced_metadata = self.metadata_extractor.extract_enhanced_metadata(pages_data, url, sitemap)
             
             # Step 6: Compile comprehensive summary data
@@ -2136,6 +2760,10 @@ class EnhancedCompleteWebsiteAnalyzer:
             # Step 8: Save master JSON
             self._save_enhanced_master_json(summary_data, base_folder, domain)
             
+            # Raw data and images must be on disk before the site counts as done
+            io_pool.shutdown(wait=True)
+            image_downloader.shutdown()
+            
             logger.info(f"Comprehensive enhanced analysis completed for {url}")
             return summary_data
             
@@ -2143,32 +2771,46 @@ class EnhancedCompleteWebsiteAnalyzer:
             logger.error(f"Critical error analyzing {url}: {e}")
             return {}
         finally:
-            driver_manager.quit()
+            io_pool.shutdown(wait=True)  # All downloads are queued once the io tasks finish
+            image_downloader.shutdown()
+            driver_pool.quit()
+            soup_cache.clear()
     
-    def _analyze_all_discovered_pages(self, sitemap: SiteMap, driver_manager: EnhancedWebDriverManager) -> List[PageMetadata]:
+    def _analyze_all_discovered_pages(self, sitemap: SiteMap, driver_pool: EnhancedWebDriverPool,
+                                      soup_cache: Optional[PageSoupCache] = None) -> List[PageMetadata]:
         """Analyze all discovered pages from sitemap"""
         pages_data = []
         
-        # Get all unique URLs from sitemap
-        all_urls = set()
-        all_urls.add(sitemap.main_url)
-        
+        # Get all unique URLs from sitemap, main page first and the rest in
+        # discovery order, so the limit below never drops the main page.
+        # Variants of one page (fragment, tracking parameters, trailing slash)
+        # are fetched once, under the first URL seen, so workers need no
+        # shared processed-URL set.
+        all_urls = {canonicalize_url(sitemap.main_url): sitemap.main_url}
         for link in sitemap.internal_links:
-            all_urls.add(link.url)
+            all_urls.setdefault(canonicalize_url(link.url), link.url)
+        
+        # pages_data[0] must be the main page, so a site whose main page robots.txt
+        # disallows is not analyzed at all
+        if not robots_allows(sitemap.main_url):
+            logger.warning(f"robots.txt disallows {sitemap.main_url}; no pages analyzed")
+            return pages_data
         
-        # Limit to MAX_PAGES_PER_SITE
-        urls_to_analyze = list(all_urls)[:config.MAX_PAGES_PER_SITE]
+        # Skip pages robots.txt disallows before queueing them, then limit to MAX_PAGES_PER_SITE
+        urls_to_analyze = [url for url in all_urls.values() if robots_allows(url)][:config.MAX_PAGES_PER_SITE]
         
         logger.info(f"Analyzing {len(urls_to_analyze)} discovered pages")
         
-        # Analyze pages with controlled parallelism
+        # Analyze pages with controlled parallelism. Fetches overlap on the shared
+        # pooled sessions; results are collected in submission order so that
+        # pages_data[0] is the main page the extractors expect.
         with ThreadPoolExecutor(max_workers=config.MAX_WORKERS) as executor:
-            futures = {
-                executor.submit(self._analyze_single_page_enhanced, url, EnhancedWebDriverManager()): url 
+            futures = [
+                executor.submit(self._analyze_single_page_enhanced, url, driver_pool, soup_cache)
                 for url in urls_to_analyze
-            }
+            ]
             
-            for future in as_completed(futures):
+            for future in futures:
                 try:
                     page_data = future.result()
                     if page_data:
@@ -2179,74 +2821,79 @@ class EnhancedCompleteWebsiteAnalyzer:
         logger.info(f"Successfully analyzed {len(pages_data)} pages")
         return pages_data
     
-    def _analyze_single_page_enhanced(self, url: str, driver_manager: EnhancedWebDriverManager) -> Optional[PageMetadata]:
+    def _analyze_single_page_enhanced(self, url: str, driver_pool: EnhancedWebDriverPool,
+                                      soup_cache: Optional[PageSoupCache] = None) -> Optional[PageMetadata]:
         """Analyze individual page with enhanced extraction"""
         start_time = time.time()
         
-        # Skip if already processed
-        with THREAD_LOCK:
-            if url in processed_urls:
-                return None
-            processed_urls.add(url)
-        
         logger.debug(f"Analyzing enhanced page: {url}")
         
         try:
             # Try HTTP first
             html, status_code = self.http_client.get_with_retry(url)
             
-            # Fallback to Selenium if needed
-            if not html or len(html) < config.MIN_HTML_LENGTH:
+            # Fall back to a browser only when HTTP failed or returned a client-rendered shell
+            if not html or requires_js(html):
                 try:
-                    driver = driver_manager.get_driver()
-                    driver.get(url)
-                    time.sleep(2)
-                    html = driver.page_source
+                    with driver_pool.acquire() as driver:
+                        driver.get(url)
+                        time.sleep(2)
+                        html = driver.page_source
                     status_code = 200
                 except Exception as e:
                     logger.warning(f"Selenium failed for {url}: {e}")
-                    return None
+                    if not html:
+                        return None
             
             if not html:
                 return None
             
             
-            # Parse HTML
-            soup = BeautifulSoup(html, 'html.parser')
-            text_content = soup.get_text(separator=' ', strip=True)
+            # Parse HTML (the tree is kept for the extraction passes, within soup_cache's bound)
+            soup = BeautifulSoup(html, HTML_PARSER)
+            text_parts, title_tag, desc_tag, meta_tags, json_ld_scripts = self._walk_page_tree(soup)
+            text_content = ' '.join(text_parts)
             
             # Create enhanced page metadata
             page_data = PageMetadata(url=url)
             page_data.html = html
+            page_data.soup = soup
+            page_data.soup_cache = soup_cache
+            if soup_cache is not None:
+                soup_cache.touch(page_data)
             page_data.text_content = text_content
             page_data.status_code = status_code
             page_data.load_time = time.time() - start_time
             page_data.word_count = len(text_content.split())
             
-            # Extract metadata
-            page_data.title = soup.title.string.strip() if soup.title else None
+            # Extract metadata. Templated sites repeat titles ("Blog | Acme") across
+            # many pages, so equal titles are interned to share one string.
+            page_data.title = sys.intern(title_tag.string.strip()) if title_tag else None
             
             # Meta description
-            desc_tag = soup.find('meta', attrs={'name': 'description'})
             if desc_tag:
                 page_data.description = desc_tag.get('content', '')
             
             # Extract meta tags
-            for meta in soup.find_all('meta'):
+            for meta in meta_tags:
                 tag_data = {k: meta.get(k) for k in meta.attrs}
                 page_data.meta_tags.append(tag_data)
             
             # Extract JSON-LD
-            for script in soup.find_all('script', type='application/ld+json'):
+            for script in json_ld_scripts:
                 try:
                     data = json.loads(script.string.strip())
                     page_data.json_ld.append(data)
                 except:
                     continue
             
+            # Detect maps against the same tree while it is at hand
+            self.maps_detector.analyze_page(page_data, soup)
+            
             # Determine page type
-            page_data.page_type = self._determine_page_type(url, text_content)
-            page_data.is_contact_page = 'contact' in url.lower() or 'contact' in text_content.lower()
+            url_lower = url.lower()
+            page_data.page_type = self._determine_page_type(url_lower)
+            page_data.is_contact_page = 'contact' in url_lower or 'contact' in text_content.lower()
             
             logger.debug(f"Successfully analyzed enhanced page: {url}")
             return page_data
@@ -2254,26 +2901,43 @@ class EnhancedCompleteWebsiteAnalyzer:
         except Exception as e:
             logger.error(f"Error analyzing enhanced page {url}: {e}")
             return None
-        finally:
-            driver_manager.quit()
-    
-    def _determine_page_type(self, url: str, text_content: str) -> str:
-        """Determine the type of page based on URL and content"""
-        url_lower = url.lower()
-        text_lower = text_content.lower()
-        
-        if any(keyword in url_lower for keyword in ['about', 'story', 'company']):
-            return 'about'
-        elif any(keyword in url_lower for keyword in ['contact', 'reach', 'touch']):
-            return 'contact'
-        elif any(keyword in url_lower for keyword in ['product', 'service', 'solution']):
-            return 'product'
-        elif any(keyword in url_lower for keyword in ['blog', 'news', 'article']):
-            return 'blog'
-        elif any(keyword in url_lower for keyword in ['team', 'staff', 'people']):
-            return 'team'
-        else:
-            return 'general'
+    
+    def _walk_page_tree(self, soup: BeautifulSoup) -> Tuple[List[str], Optional[Tag], Optional[Tag], List[Tag], List[Tag]]:
+        """
+        Collect in one walk over the tree what page analysis reads from it: the
+        stripped text strings (as get_text(strip=True) joins them), the first
+        <title>, the first <meta name="description">, every <meta> and every
+        JSON-LD <script>.
+        """
+        text_parts = []
+        title_tag = None
+        desc_tag = None
+        meta_tags = []
+        json_ld_scripts = []
+        for element in soup.descendants:
+            element_type = type(element)
+            if element_type is NavigableString or element_type is CData:
+                stripped = element.strip()
+                if stripped:
+                    text_parts.append(stripped)
+            elif element_type is Tag:
+                name = element.name
+                if name == 'meta':
+                    meta_tags.append(element)
+                    if desc_tag is None and element.get('name') == 'description':
+                        desc_tag = element
+                elif name == 'title':
+                    if title_tag is None:
+                        title_tag = element
+                elif name == 'script' and element.get('type') == 'application/ld+json':
+                    json_ld_scripts.append(element)
+        return text_parts, title_tag, desc_tag, meta_tags, json_ld_scripts
+    
+    def _determine_page_type(self, url_lower: str) -> str:
+        """Determine the type of page based on its lowercased URL"""
+        # One scan finds every keyword; the highest-priority type among them wins
+        ranks = [PAGE_TYPE_RANK[keyword] for keyword in PAGE_TYPE_RE.findall(url_lower)]
+        return PAGE_TYPE_KEYWORDS[min(ranks)][0] if ranks else 'general'
     
     def _save_comprehensive_raw_data(self, pages_data: List[PageMetadata], sitemap: SiteMap, base_folder: Path, domain: str):
         """Save comprehensive raw data including sitemap"""
@@ -2335,11 +2999,11 @@ class EnhancedCompleteWebsiteAnalyzer:
                 for link in sitemap.contact_links
             ],
             'google_maps_info': {
-                'maps_links': sitemap.google_maps_info.maps_links,
-                'iframe_embeds': sitemap.google_maps_info.iframe_embeds,
-                'javascript_maps': sitemap.google_maps_info.javascript_maps,
-                'structured_data_maps': sitemap.google_maps_info.structured_data_maps,
-                'contact_page_maps': sitemap.google_maps_info.contact_page_maps,
+                'maps_links': sorted(sitemap.google_maps_info.maps_links),
+                'iframe_embeds': sorted(sitemap.google_maps_info.iframe_embeds),
+                'javascript_maps': sorted(sitemap.google_maps_info.javascript_maps),
+                'structured_data_maps': sorted(sitemap.google_maps_info.structured_data_maps),
+                'contact_page_maps': sorted(sitemap.google_maps_info.contact_page_maps),
                 'all_maps_links': sitemap.google_maps_info.all_maps_links,
                 'primary_maps_link': sitemap.google_maps_info.primary_maps_link,
                 'maps_integration_status': sitemap.google_maps_info.maps_integration_status,
@@ -2352,8 +3016,13 @@ class EnhancedCompleteWebsiteAnalyzer:
        # ============================================================================
        
 
-    def _save_comprehensive_raw_data(self, pages_data: List[PageMetadata], sitemap: SiteMap, base_folder: Path, domain: str):
-        """Save comprehensive raw data with duplicate prevention"""
+    def _save_comprehensive_raw_data(self, pages_data: List[PageMetadata], sitemap: SiteMap, base_folder: Path, domain: str,
+                                     io_pool: ThreadPoolExecutor, image_downloader: ImageDownloader):
+        """
+        Save comprehensive raw data with duplicate prevention. The data is
+        snapshotted here and the file writes are queued on io_pool, so they
+        overlap with the extraction phases. Image downloads go to image_downloader.
+        """
         logger.info("Saving comprehensive raw data with duplicate prevention")
         
         # Create directories
@@ -2379,12 +3048,12 @@ class EnhancedCompleteWebsiteAnalyzer:
             'social_links': [],
             'contact_links': [],
             'google_maps_info': {
-                'maps_links': sitemap.google_maps_info.maps_links,
-                'iframe_embeds': sitemap.google_maps_info.iframe_embeds,
-                'javascript_maps': sitemap.google_maps_info.javascript_maps,
-                'structured_data_maps': sitemap.google_maps_info.structured_data_maps,
-                'contact_page_maps': sitemap.google_maps_info.contact_page_maps,
-                'all_maps_links': list(set(sitemap.google_maps_info.all_maps_links)),  # Deduplicate
+                'maps_links': sorted(sitemap.google_maps_info.maps_links),
+                'iframe_embeds': sorted(sitemap.google_maps_info.iframe_embeds),
+                'javascript_maps': sorted(sitemap.google_maps_info.javascript_maps),
+                'structured_data_maps': sorted(sitemap.google_maps_info.structured_data_maps),
+                'contact_page_maps': sorted(sitemap.google_maps_info.contact_page_maps),
+                'all_maps_links': sitemap.google_maps_info.all_maps_links,
                 'primary_maps_link': sitemap.google_maps_info.primary_maps_link,
                 'maps_integration_status': sitemap.google_maps_info.maps_integration_status,
                 'total_maps_found': sitemap.google_maps_info.total_maps_found
@@ -2439,13 +3108,11 @@ class EnhancedCompleteWebsiteAnalyzer:
                 })
         
         # Save sitemap JSON
-        with open(sitemap_folder / f"{domain}_complete_sitemap.json", 'w', encoding='utf-8') as f:
-            json.dump(sitemap_data, f, indent=2, ensure_ascii=False)
+        io_pool.submit(self._write_json_file, sitemap_folder / f"{domain}_complete_sitemap.json", sitemap_data)
         
         # Save human-readable sitemap summary
         sitemap_summary = self._generate_sitemap_summary(sitemap)
-        with open(sitemap_folder / f"{domain}_sitemap_summary.txt", 'w', encoding='utf-8') as f:
-            f.write(sitemap_summary)
+        io_pool.submit(self._write_text_file, sitemap_folder / f"{domain}_sitemap_summary.txt", sitemap_summary)
         
         # Save HTML and JSON for each page
         for i, page in enumerate(pages_data):
@@ -2453,8 +3120,7 @@ class EnhancedCompleteWebsiteAnalyzer:
             
             # Save HTML
             if page.html:
-                with open(html_folder / f"{filename}.html", 'w', encoding='utf-8') as f:
-                    f.write(page.html)
+                io_pool.submit(self._write_text_file, html_folder / f"{filename}.html", page.html)
             
             # Save JSON metadata
             page_json = {
@@ -2473,13 +3139,28 @@ class EnhancedCompleteWebsiteAnalyzer:
                 'google_maps_found': page.google_maps_found
             }
             
-            with open(json_folder / f"{filename}.json", 'w', encoding='utf-8') as f:
-                json.dump(page_json, f, indent=2, ensure_ascii=False)
+            io_pool.submit(self._write_json_file, json_folder / f"{filename}.json", page_json)
             
             # Download images
-            self._download_images(page.html, page.url, images_folder)
+            io_pool.submit(self._download_images, page.html, page.url, images_folder, image_downloader)
         
-        logger.info("Comprehensive raw data saved successfully")
+        logger.info("Comprehensive raw data queued for saving")
+    
+    def _write_text_file(self, path: Path, text: str):
+        """Write a UTF-8 text file, logging rather than raising on failure"""
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+        except Exception as e:
+            logger.error(f"Error saving {path}: {e}")
+    
+    def _write_json_file(self, path: Path, data: Any):
+        """Write data as indented UTF-8 JSON, logging rather than raising on failure"""
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            logger.error(f"Error saving {path}: {e}")
     
     def _generate_sitemap_summary(self, sitemap: SiteMap) -> str:
         """Generate human-readable sitemap summary"""
@@ -2602,31 +3283,27 @@ Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         
         return summary
     
-    def _download_images(self, html: str, base_url: str, images_folder: Path):
-        """Download images from HTML"""
+    def _download_images(self, html: str, base_url: str, images_folder: Path, image_downloader: ImageDownloader):
+        """Queue the images referenced in HTML on the site's shared downloader"""
         if not html:
             return
         
-        soup = BeautifulSoup(html, 'html.parser')
+        # Only <img> tags are needed, so build nothing else
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=SoupStrainer('img'))
         
+        # The downloader fetches each file name once per site; files saved
+        # from earlier pages (shared logos, icons) are not fetched again
         for img in soup.find_all('img', src=True):
             try:
                 img_url = urljoin(base_url, img['src'])
-                parsed = urlparse(img_url)
-                filename = os.path.basename(parsed.path.split("?")[0])
-                
-                if not filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp')):
-                    continue
-                
-                # Download image
-                response = requests.get(img_url, timeout=5)
-                if response.status_code == 200:
-                    with open(images_folder / filename, 'wb') as f:
-                        f.write(response.content)
-                        
-            except Exception as e:
+            except ValueError as e:
                 logger.debug(f"Failed to download image {img.get('src')}: {e}")
                 continue
+            parsed = urlparse(img_url)
+            filename = os.path.basename(parsed.path.split("?")[0])
+            
+            if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp')):
+                image_downloader.submit(img_url, images_folder / filename)
     
     def _clean_filename(self, url: str, domain: str, index: int) -> str:
         """Generate clean filename for URL"""
@@ -2903,7 +3580,10 @@ Total Processing Time: {avg_load_time * len(pages_data):.1f} seconds
         
         # Convert dataclasses to dictionaries for JSON serialization
         def convert_to_dict(obj):
-            if hasattr(obj, '__dict__'):
+            if is_dataclass(obj):
+                # Skip repr=False fields such as cached parse trees
+                return {f.name: getattr(obj, f.name) for f in fields(obj) if f.repr}
+            elif hasattr(obj, '__dict__'):
                 return obj.__dict__
             elif isinstance(obj, list):
                 return [convert_to_dict(item) for item in obj]
@@ -2943,7 +3623,7 @@ def save_unique_json_pages(pages_data: List, output_folder: Path):
             }
 
             json_str = json.dumps(page_data, sort_keys=True)
-            content_hash = hashlib.md5(json_str.encode('utf-8')).hexdigest()
+            content_hash = hashlib.sha256(json_str.encode('utf-8')).digest()[:16]
 
             if content_hash in seen_hashes:
                 logger.info(f"Duplicate content found for {page.url}, skipping save.")
@@ -3032,6 +3712,7 @@ def analyze_websites_comprehensive_enhanced(csv_file: str = 'websites.csv'):
         logger.error(f"Critical error in enhanced comprehensive execution: {e}")
 
 if __name__ == '__main__':
+    setup_enhanced_logging()
     analyze_websites_comprehensive_enhanced()
 
  
\ No newline at end of file
@@ -0,0 +1,81 @@
+import random
+import sys
+import unittest
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import complete_website_analyzer as cwa
+
+TAGS = ['div', 'p', 'main', 'article', 'nav', 'footer', 'header', 'aside', 'script', 'style', 'section', 'span']
+CLASSES = ['', 'content', 'about-content', 'x']
+SNIPPETS = [
+    'We build great things for customers everywhere',
+    'Our mission is long and meaningful today',
+    'home',
+    '<!-- comment -->',
+    '<![CDATA[raw data]]>',
+    'x' * 30,
+]
+
+
+def random_markup(rng: random.Random, depth: int = 0) -> str:
+    """Random nesting of content and page-chrome tags"""
+    markup = ''
+    for _ in range(rng.randint(1, 4)):
+        tag = rng.choice(TAGS)
+        if depth < 4 and rng.random() < 0.6:
+            inner = random_markup(rng, depth + 1)
+        else:
+            inner = ' '.join(rng.choice(SNIPPETS) for _ in range(rng.randint(1, 5)))
+        markup += f'<{tag} class="{rng.choice(CLASSES)}">{inner}</{tag}>'
+    return markup
+
+
+def decomposed_about_text(extractor: cwa.EnhancedMetadataExtractor, html: str):
+    """The about text as extracted by decomposing page chrome out of a fresh tree"""
+    soup = BeautifulSoup(html, cwa.HTML_PARSER)
+    for element in soup(cwa.ABOUT_EXCLUDED_TAGS):
+        element.decompose()
+    for selector in extractor.content_selectors:
+        content_area = soup.select_one(selector)
+        if content_area:
+            text = content_area.get_text(separator=' ', strip=True)
+            if len(text) > 100:
+                return extractor._clean_about_text(text)
+    body = soup.find('body')
+    if body:
+        return extractor._clean_about_text(body.get_text(separator=' ', strip=True))[:cwa.ABOUT_TEXT_LIMIT]
+    return None
+
+
+class AboutTextTest(unittest.TestCase):
+    def setUp(self):
+        self.extractor = cwa.EnhancedMetadataExtractor()
+
+    def test_matches_decomposed_tree_on_random_documents(self):
+        rng = random.Random(1)
+        for _ in range(500):
+            html = f'<html><body>{random_markup(rng)}</body></html>'
+            page = cwa.PageMetadata(url='https://example.com/about', html=html, text_content='about')
+            with self.subTest(html=html):
+                self.assertEqual(
+                    self.extractor._extract_about_text_from_page(page),
+                    decomposed_about_text(self.extractor, html)
+                )
+
+    def test_strings_outside_ignores_excluded_ancestors_of_the_root(self):
+        soup = BeautifulSoup(
+            '<header><main><p>Kept</p><nav>Dropped</nav><p>Also kept</p></main></header>',
+            cwa.HTML_PARSER
+        )
+        self.assertEqual(
+            list(cwa.strings_outside(soup.main, cwa.ABOUT_EXCLUDED_TAGS)),
+            ['Kept', 'Also kept']
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import sys
+import unittest
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import complete_website_analyzer as cwa
+
+
+def by_href(soup: BeautifulSoup, mapping):
+    """Map each <a href> in soup to its entry in an id()-keyed mapping"""
+    return {a['href']: mapping[id(a)] for a in soup.find_all('a', href=True)}
+
+
+class MapLinkAncestryTest(unittest.TestCase):
+    def ancestry(self, html: str):
+        soup = BeautifulSoup(html, cwa.HTML_PARSER)
+        return {
+            href: (in_nav, in_footer, context.name if context else None)
+            for href, (in_nav, in_footer, context) in by_href(soup, cwa.map_link_ancestry(soup)).items()
+        }
+
+    def test_nav_footer_and_nearest_context(self):
+        self.assertEqual(self.ancestry(
+            '<nav><ul><li><a href="/nav">n</a></li></ul></nav>'
+            '<div id="TopMenu"><span><a href="/menu">m</a></span></div>'
+            '<footer><p><a href="/footer">f</a></p></footer>'
+            '<section><span><a href="/body">b</a></span></section>'
+            '<a href="/bare">x</a>'
+        ), {
+            '/nav': (True, False, 'li'),
+            '/menu': (True, False, 'div'),
+            '/footer': (False, True, 'p'),
+            '/body': (False, False, 'section'),
+            '/bare': (False, False, None),
+        })
+
+    def test_anchors_without_href_are_skipped(self):
+        soup = BeautifulSoup('<nav><a name="top">t</a><a href="/a">a</a></nav>', cwa.HTML_PARSER)
+        self.assertEqual(len(cwa.map_link_ancestry(soup)), 1)
+
+    def test_matches_find_parent_lookups(self):
+        soup = BeautifulSoup(
+            '<header><div class="x"><nav><p><a href="/1">1</a></p></nav></div></header>'
+            '<main><article><li><a href="/2">2</a></li></article></main>'
+            '<footer><div id="bottom"><a href="/3">3</a></div></footer>',
+            cwa.HTML_PARSER
+        )
+        ancestry = cwa.map_link_ancestry(soup)
+        for a in soup.find_all('a', href=True):
+            with self.subTest(href=a['href']):
+                in_nav, in_footer, context = ancestry[id(a)]
+                self.assertEqual(in_nav, a.find_parent(['nav']) is not None or any(
+                    parent.get('id') and cwa.NAV_ID_RE.search(parent.get('id')) for parent in a.parents
+                ))
+                self.assertEqual(in_footer, a.find_parent('footer') is not None)
+                self.assertIs(context, a.find_parent(cwa.LINK_CONTEXT_TAGS))
+
+
+class MapLinkRegionsTest(unittest.TestCase):
+    def regions(self, html: str):
+        soup = BeautifulSoup(html, cwa.HTML_PARSER)
+        discoverer = cwa.ComprehensiveLinkDiscoverer(http_client=None)
+        return by_href(soup, discoverer._map_link_regions(soup))
+
+    def test_marked_containers_by_class_id_and_tag(self):
+        self.assertEqual(self.regions(
+            '<div class="main-nav"><ul><li><a href="/nav">n</a></li></ul></div>'
+            '<div id="site-header"><a href="/header">h</a></div>'
+            '<footer><p><a href="/footer">f</a></p></footer>'
+            '<div class="copyright"><a href="/copyright">c</a></div>'
+            '<a href="/body">b</a>'
+        ), {
+            '/nav': (True, False),
+            '/header': (True, False),
+            '/footer': (False, True),
+            '/copyright': (False, True),
+            '/body': (False, False),
+        })
+
+    def test_only_five_ancestor_levels_count(self):
+        def nested(depth: int, href: str) -> str:
+            return '<div class="menu">' + '<div>' * depth + f'<a href="{href}">x</a>' + '</div>' * depth + '</div>'
+
+        # The marked container is the link's parent plus `depth` levels up
+        regions = self.regions(nested(4, '/fifth-level') + nested(5, '/sixth-level'))
+        self.assertEqual(regions['/fifth-level'], (True, False))
+        self.assertEqual(regions['/sixth-level'], (False, False))
+
+
+if __name__ == '__main__':
+    unittest.main()
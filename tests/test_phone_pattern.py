@@ -0,0 +1,60 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import complete_website_analyzer as cwa
+
+NUMBER = '(415) 555-2671'
+
+
+class PhonePatternTest(unittest.TestCase):
+    def setUp(self):
+        self.extractor = cwa.EnhancedContactExtractor()
+
+    def phones(self, text: str):
+        """Phone types found in text, mapped to their formatted numbers"""
+        phones, _, _ = self.extractor._scan_page_text(text)
+        return {phone_type: numbers for phone_type, numbers in phones.items() if numbers}
+
+    def test_common_formats_are_found(self):
+        for text in ('Call (415) 555-2671', 'Call 415-555-2671', 'Call 415.555.2671',
+                     'Call 415 555 2671', 'Call 4155552671', 'Call +1 415-555-2671', 'Call 1-415-555-2671'):
+            with self.subTest(text=text):
+                self.assertEqual(self.phones(text), {'general': {NUMBER}})
+
+    def test_labels_assign_a_type(self):
+        cases = {
+            'Mobile: 415-555-2671': 'mobile',
+            'cell 415-555-2671': 'mobile',
+            'Corporate: 415-555-2671': 'corporate',
+            'Headquarters 415-555-2671': 'corporate',
+            'Main: 415-555-2671': 'corporate',
+            'Support: 415-555-2671': 'support',
+            'Customer Service: (415) 555-2671': 'support',
+            'customerservice 415-555-2671': 'support',
+            'Help: 415-555-2671': 'support',
+        }
+        for text, phone_type in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(self.phones(text), {phone_type: {NUMBER}, 'general': {NUMBER}})
+
+    def test_labels_must_be_whole_words(self):
+        for text in ('Helpdesk 415-555-2671', 'Domain: 415-555-2671', 'callmobile 415-555-2671'):
+            with self.subTest(text=text):
+                self.assertEqual(self.phones(text), {'general': {NUMBER}})
+
+    def test_numbers_are_not_cut_from_longer_digit_runs(self):
+        for text in ('Order 1234155552671999', 'Tracking 94155552671', 'Ref 415-555-26719'):
+            with self.subTest(text=text):
+                self.assertEqual(self.phones(text), {})
+
+    def test_invalid_area_and_exchange_codes_are_rejected(self):
+        for text in ('Call 115-555-2671', 'Call 415-155-2671', 'Call 911-555-2671', 'Call 415-911-2671'):
+            with self.subTest(text=text):
+                self.assertEqual(self.phones(text), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
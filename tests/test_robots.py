@@ -0,0 +1,112 @@
+import socket
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import complete_website_analyzer as cwa
+
+
+def robots_handler(status: int, body: str):
+    """Request handler answering every GET with the given status and body"""
+    class RobotsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            payload = body.encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/plain')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    return RobotsHandler
+
+
+class LocalServerTestCase(unittest.TestCase):
+    """Serves robots.txt from throwaway local origins"""
+
+    def setUp(self):
+        cwa.get_robots_parser.cache_clear()
+        self.addCleanup(cwa.get_robots_parser.cache_clear)
+
+    def serve_robots(self, status: int, body: str = '') -> str:
+        server = ThreadingHTTPServer(('127.0.0.1', 0), robots_handler(status, body))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+class RobotsTest(LocalServerTestCase):
+    def test_rules_apply_per_path(self):
+        origin = self.serve_robots(200, 'User-agent: *\nDisallow: /private\n')
+        self.assertTrue(cwa.robots_allows(f"{origin}/public/page"))
+        self.assertFalse(cwa.robots_allows(f"{origin}/private/page"))
+
+    def test_access_controlled_robots_disallows_everything(self):
+        for status in (401, 403):
+            with self.subTest(status=status):
+                origin = self.serve_robots(status)
+                self.assertFalse(cwa.robots_allows(f"{origin}/"))
+
+    def test_missing_or_failing_robots_allows_everything(self):
+        for status in (404, 500):
+            with self.subTest(status=status):
+                origin = self.serve_robots(status)
+                self.assertIsNone(cwa.get_robots_parser(origin))
+                self.assertTrue(cwa.robots_allows(f"{origin}/anything"))
+
+    def test_unreachable_host_allows_everything(self):
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        self.assertTrue(cwa.robots_allows(f"http://127.0.0.1:{port}/"))
+
+    def test_robots_is_fetched_once_per_origin(self):
+        origin = self.serve_robots(200, 'User-agent: *\nDisallow:\n')
+        self.assertIs(cwa.get_robots_parser(origin), cwa.get_robots_parser(origin))
+
+    def test_url_origin_keeps_scheme_host_and_port(self):
+        self.assertEqual(cwa.url_origin('https://acme.com:8443/a/b?c=d'), 'https://acme.com:8443')
+
+
+class HostRateLimiterTest(LocalServerTestCase):
+    def waits(self, limiter: cwa.HostRateLimiter, urls):
+        """Seconds slept before each request to urls, in order"""
+        slept = []
+        with mock.patch.object(cwa.time, 'sleep', side_effect=slept.append):
+            for url in urls:
+                before = len(slept)
+                limiter.wait(url)
+                if len(slept) == before:
+                    slept.append(0.0)
+        return slept
+
+    def test_spaces_requests_to_one_host(self):
+        origin = self.serve_robots(404)
+        interval = 1.0 / cwa.config.REQUESTS_PER_SECOND
+        slept = self.waits(cwa.HostRateLimiter(), [f"{origin}/{i}" for i in range(3)])
+        self.assertEqual(slept[0], 0.0)
+        self.assertAlmostEqual(slept[1], interval, delta=0.05)
+        self.assertAlmostEqual(slept[2], 2 * interval, delta=0.05)
+
+    def test_hosts_do_not_wait_on_each_other(self):
+        first, second = self.serve_robots(404), self.serve_robots(404)
+        slept = self.waits(cwa.HostRateLimiter(), [f"{first}/", f"{second}/"])
+        self.assertEqual(slept, [0.0, 0.0])
+
+    def test_honours_a_longer_crawl_delay(self):
+        origin = self.serve_robots(200, 'User-agent: *\nCrawl-delay: 3\n')
+        slept = self.waits(cwa.HostRateLimiter(), [f"{origin}/a", f"{origin}/b"])
+        self.assertEqual(slept[0], 0.0)
+        self.assertAlmostEqual(slept[1], 3.0, delta=0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import complete_website_analyzer as cwa
+
+
+class CanonicalizeUrlTest(unittest.TestCase):
+    def test_lowercases_scheme_and_host_but_not_path(self):
+        self.assertEqual(cwa.canonicalize_url('HTTPS://Acme.COM/About-Us'), 'https://acme.com/About-Us')
+
+    def test_drops_default_port_only(self):
+        self.assertEqual(cwa.canonicalize_url('http://acme.com:80/a'), 'http://acme.com/a')
+        self.assertEqual(cwa.canonicalize_url('https://acme.com:443/a'), 'https://acme.com/a')
+        self.assertEqual(cwa.canonicalize_url('https://acme.com:8443/a'), 'https://acme.com:8443/a')
+
+    def test_collapses_duplicate_and_trailing_slashes(self):
+        self.assertEqual(cwa.canonicalize_url('https://acme.com//a//b/'), 'https://acme.com/a/b')
+        self.assertEqual(cwa.canonicalize_url('https://acme.com'), 'https://acme.com/')
+
+    def test_drops_fragment_and_tracking_parameters_and_sorts_query(self):
+        self.assertEqual(
+            cwa.canonicalize_url('https://acme.com/p?utm_source=x&b=2&FBCLID=y&a=1#top'),
+            'https://acme.com/p?a=1&b=2'
+        )
+
+    def test_keeps_blank_query_values(self):
+        self.assertEqual(cwa.canonicalize_url('https://acme.com/p?flag'), 'https://acme.com/p?flag=')
+
+    def test_keeps_ipv6_literal_brackets(self):
+        self.assertEqual(cwa.canonicalize_url('http://[::1]:8080/a/'), 'http://[::1]:8080/a')
+
+    def test_variants_of_one_page_compare_equal(self):
+        variants = [
+            'https://www.acme.com/products',
+            'https://www.acme.com/products/',
+            'HTTPS://WWW.ACME.COM:443/products#reviews',
+            'https://www.acme.com//products?utm_campaign=spring',
+        ]
+        self.assertEqual(len({cwa.canonicalize_url(url) for url in variants}), 1)
+
+
+class UrlFingerprintTest(unittest.TestCase):
+    def test_is_a_stable_16_byte_digest(self):
+        fingerprint = cwa.url_fingerprint('https://acme.com/')
+        self.assertIsInstance(fingerprint, bytes)
+        self.assertEqual(len(fingerprint), 16)
+        self.assertEqual(fingerprint, cwa.url_fingerprint('https://acme.com/'))
+
+    def test_distinguishes_urls(self):
+        self.assertNotEqual(cwa.url_fingerprint('https://acme.com/a'), cwa.url_fingerprint('https://acme.com/b'))
+
+    def test_accepts_lone_surrogates(self):
+        self.assertEqual(len(cwa.url_fingerprint('https://acme.com/\udcff')), 16)
+
+
+if __name__ == '__main__':
+    unittest.main()